@@ -1,10 +1,9 @@
 """Baseplate command for standalone baseplate generation."""
 
-from pathlib import Path
-
 import click
 
 from gridfinity_tools.core.baseplate_generator import BaseplateGenerator
+from gridfinity_tools.utils.export import ensure_output_dir
 from gridfinity_tools.utils.naming import generate_baseplate_filename
 
 
@@ -60,9 +59,8 @@ def baseplate_command(
             corner_screws=corner_screws,
         )
 
-        # Create output directory
-        output_path = Path(output)
-        output_path.mkdir(parents=True, exist_ok=True)
+        # Create output directory (resolved once, reused for all reporting)
+        output_path = ensure_output_dir(output)
 
         # Generate filename
         filename = generate_baseplate_filename(
@@ -85,9 +83,15 @@ def baseplate_command(
         elif format == "svg":
             gen.save_svg(file_path)
 
-        click.echo("✨ Generation complete!")
-        click.echo(f"📄 {filename}")
-        click.echo(f"💾 Output directory: {output_path.resolve()}")
+        click.echo(
+            "\n".join(
+                [
+                    "✨ Generation complete!",
+                    f"📄 {filename}",
+                    f"💾 Output directory: {output_path}",
+                ]
+            )
+        )
 
     except ValueError as e:
         click.echo(f"❌ Error: {e}", err=True)
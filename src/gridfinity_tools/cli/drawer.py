@@ -1,11 +1,14 @@
 """Drawer command for complete drawer solutions."""
 
-from pathlib import Path
+import os
+from collections import Counter
 
 import click
 
+from gridfinity_tools.constants import DEFAULT_PRINTER, PRINTER_CHOICES
 from gridfinity_tools.core.drawer_generator import DrawerGenerator
 from gridfinity_tools.core.printer import PrinterConfig
+from gridfinity_tools.utils.export import ensure_output_dir
 from gridfinity_tools.utils.units import parse_dimension
 
 
@@ -15,8 +18,8 @@ from gridfinity_tools.utils.units import parse_dimension
 @click.option(
     "--printer",
     "-p",
-    type=click.Choice(["bambu-x1c", "bambu-p1p", "prusa-mk4", "prusa-mini", "ender3"]),
-    default="bambu-x1c",
+    type=click.Choice(PRINTER_CHOICES),
+    default=DEFAULT_PRINTER,
     help="Printer model (default: bambu-x1c)",
 )
 @click.option(
@@ -63,6 +66,18 @@ from gridfinity_tools.utils.units import parse_dimension
     default="output",
     help="Output directory (default: output)",
 )
+@click.option(
+    "--assembly/--no-assembly",
+    default=False,
+    help="Also export the full spacer assembly as a STEP reference file (default: off)",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of parallel worker processes (default: number of CPUs)",
+)
 def drawer_command(
     width: str,
     depth: str,
@@ -74,6 +89,8 @@ def drawer_command(
     no_arrows: bool,
     no_align: bool,
     output: str,
+    assembly: bool,
+    jobs: int | None,
 ) -> None:
     """Generate a complete drawer solution with spacers and baseplate(s).
 
@@ -91,6 +108,9 @@ def drawer_command(
 
         Generate with custom tolerance and corner screws:
         $ gridfinity-tools drawer 330 340 -t 0.5 --corner-screws
+
+        Also export the full spacer assembly as a STEP reference:
+        $ gridfinity-tools drawer 330 340 --assembly
     """
     try:
         # Parse dimensions
@@ -120,38 +140,42 @@ def drawer_command(
         solution = gen.get_solution()
         layout = solution.baseplate_layout
 
-        click.echo(
+        # Create output directory (resolved once, reused for all reporting)
+        output_path = ensure_output_dir(output)
+
+        # Progress is written in one block per stage, flushed before each slow step
+        lines = [
             f"📐 Baseplate dimensions: {solution.baseplate_width_units}×"
             f"{solution.baseplate_depth_units} units "
             f"({solution.baseplate_width_units * 42}×"
             f"{solution.baseplate_depth_units * 42} mm)"
-        )
-
+        ]
         if layout.is_split:
-            click.echo(
+            lines.append(
                 f"⚠️  Baseplate will be split into {layout.total_pieces} pieces"
                 f" to fit printer constraints"
             )
         else:
-            click.echo("✅ Baseplate fits on printer in one piece")
-
-        # Create output directory
-        output_path = Path(output)
-        output_path.mkdir(parents=True, exist_ok=True)
+            lines.append("✅ Baseplate fits on printer in one piece")
+        lines.append("\n🔧 Generating components...")
+        click.echo("\n".join(lines))
 
         # Generate and save
-        click.echo("\n🔧 Generating components...")
-        results = gen.save_all(output_path)
+        results = gen.save_all(
+            output_path,
+            max_workers=jobs or os.cpu_count() or 1,
+            include_assembly=assembly,
+        )
 
         # Report results
-        click.echo("\n✨ Generation complete!")
-        click.echo("\nGenerated files:")
-        for spacer_file in results["spacers"]:
-            click.echo(f"  📄 {spacer_file.name}")
-        for baseplate_file in results["baseplates"]:
-            click.echo(f"  📄 {baseplate_file.name}")
-
-        click.echo(f"\n💾 Output directory: {output_path.resolve()}")
+        lines = ["\n✨ Generation complete!", "\nGenerated files:"]
+        lines.extend(f"  📄 {spacer_file.name}" for spacer_file in results["spacers"])
+        # Identical split pieces share a file; list each file once with its print count
+        for baseplate_file, count in Counter(results["baseplates"]).items():
+            suffix = f" (print {count}×)" if count > 1 else ""
+            lines.append(f"  📄 {baseplate_file.name}{suffix}")
+        lines.append(f"\n💾 Output directory: {output_path}")
+        click.echo("\n".join(lines))
 
     except ValueError as e:
         click.echo(f"❌ Error: {e}", err=True)
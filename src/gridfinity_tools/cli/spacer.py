@@ -1,10 +1,9 @@
 """Spacer command for standalone spacer generation."""
 
-from pathlib import Path
-
 import click
 
 from gridfinity_tools.core.spacer_generator import SpacerGenerator
+from gridfinity_tools.utils.export import ensure_output_dir
 from gridfinity_tools.utils.units import parse_dimension
 
 
@@ -114,9 +113,8 @@ def spacer_command(
             align_features=not no_align,
         )
 
-        # Create output directory
-        output_path = Path(output)
-        output_path.mkdir(parents=True, exist_ok=True)
+        # Create output directory (resolved once, reused for all reporting)
+        output_path = ensure_output_dir(output)
 
         # Generate and save
         click.echo(f"🔧 Generating spacer ({mode}, {format.upper()})...")
@@ -147,13 +145,11 @@ def spacer_command(
             file_path = output_path / filename
             gen.save_step(file_path, render_mode=mode)
 
-        click.echo("✨ Generation complete!")
-        click.echo(f"📄 {filename}")
-
+        lines = ["✨ Generation complete!", f"📄 {filename}"]
         if mode == "half_set":
-            click.echo("ℹ️  Print this file twice to create a complete set")
-
-        click.echo(f"💾 Output directory: {output_path.resolve()}")
+            lines.append("ℹ️  Print this file twice to create a complete set")
+        lines.append(f"💾 Output directory: {output_path}")
+        click.echo("\n".join(lines))
 
     except ValueError as e:
         click.echo(f"❌ Error: {e}", err=True)
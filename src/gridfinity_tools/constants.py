@@ -1,5 +1,7 @@
 """Global constants for gridfinity-tools."""
 
+from types import MappingProxyType
+
 # Gridfinity specification constants
 GRIDFINITY_UNIT = 42  # 1 Gridfinity unit = 42mm
 GRIDFINITY_HEIGHT_UNIT = 7  # 1 height unit = 7mm
@@ -17,6 +19,10 @@ DEFAULT_COUNTERSINK_DIAM = 10.0  # mm
 DEFAULT_COUNTERSINK_ANGLE = 82  # degrees
 DEFAULT_OUTPUT_DIR = "output"
 
+# STL export mesh settings (same deflection as cqgridfinity's STL export)
+DEFAULT_STL_TOLERANCE = 1e-2  # mm (linear deflection, relative to edge size)
+DEFAULT_STL_ANGULAR_TOLERANCE = 0.1  # radians
+
 # Spacer defaults
 DEFAULT_SHOW_ARROWS = True
 DEFAULT_ALIGN_FEATURES = True
@@ -24,18 +30,21 @@ DEFAULT_ALIGN_TOLERANCE = 0.15  # mm
 DEFAULT_MIN_MARGIN = 4.0  # mm
 
 # File format options
-VALID_FORMATS = {"stl", "step", "svg"}
+VALID_FORMATS = frozenset({"stl", "step", "svg"})
 DEFAULT_FORMAT_SPACER = "stl"
 DEFAULT_FORMAT_BASEPLATE = "stl"
 DEFAULT_FORMAT_ASSEMBLY = "step"
 
-# Printer presets - name: (max_width_mm, max_depth_mm)
-PRINTER_PRESETS = {
-    "bambu-x1c": ("Bambu Lab X1C", 256, 256),
-    "bambu-p1p": ("Bambu Lab P1P", 256, 256),
-    "prusa-mk4": ("Prusa MK4", 250, 210),
-    "prusa-mini": ("Prusa Mini", 180, 180),
-    "ender3": ("Ender 3", 220, 220),
-}
+# Printer presets - name: (display_name, max_width_mm, max_depth_mm)
+PRINTER_PRESETS = MappingProxyType(
+    {
+        "bambu-x1c": ("Bambu Lab X1C", 256, 256),
+        "bambu-p1p": ("Bambu Lab P1P", 256, 256),
+        "prusa-mk4": ("Prusa MK4", 250, 210),
+        "prusa-mini": ("Prusa Mini", 180, 180),
+        "ender3": ("Ender 3", 220, 220),
+    }
+)
+PRINTER_CHOICES = tuple(PRINTER_PRESETS)
 
 DEFAULT_PRINTER = "bambu-x1c"
@@ -1,17 +1,19 @@
 """Baseplate generation module."""
 
 from pathlib import Path
-from typing import Any
-
-from cqgridfinity import GridfinityBaseplate
+from typing import TYPE_CHECKING, Any
 
 from gridfinity_tools.constants import (
     DEFAULT_COUNTERSINK_ANGLE,
     DEFAULT_COUNTERSINK_DIAM,
     DEFAULT_SCREW_HOLE_DIAM,
 )
+from gridfinity_tools.utils.export import write_binary_stl
 from gridfinity_tools.utils.validation import validate_baseplate_units
 
+if TYPE_CHECKING:
+    from cqgridfinity import GridfinityBaseplate
+
 
 class BaseplateGenerator:
     """Generate Gridfinity baseplate components.
@@ -20,6 +22,18 @@ class BaseplateGenerator:
     and provides an interface for generating baseplate components.
     """
 
+    __slots__ = (
+        "units_width",
+        "units_depth",
+        "corner_screws",
+        "screw_hole_diam_mm",
+        "countersink_diam_mm",
+        "countersink_angle_deg",
+        "ext_depth_mm",
+        "straight_bottom",
+        "_baseplate",
+    )
+
     def __init__(
         self,
         units_width: int,
@@ -60,14 +74,21 @@ class BaseplateGenerator:
         # Create the underlying baseplate object
         self._baseplate: GridfinityBaseplate | None = None
 
-    def _create_baseplate(self) -> GridfinityBaseplate:
+    def _create_baseplate(self) -> "GridfinityBaseplate":
         """Create the underlying GridfinityBaseplate object (lazy initialization).
 
+        The geometry is rendered once here and kept on the baseplate object, so
+        repeated ``generate()`` / ``save_*()`` calls reuse the same solid.
+
         Returns:
             GridfinityBaseplate instance
         """
         if self._baseplate is None:
-            self._baseplate = GridfinityBaseplate(
+            # Deferred import: cqgridfinity pulls in CadQuery/OCCT, which takes
+            # seconds to load and is only needed once geometry is built
+            from cqgridfinity import GridfinityBaseplate
+
+            baseplate = GridfinityBaseplate(
                 self.units_width,
                 self.units_depth,
                 corner_screws=self.corner_screws,
@@ -77,6 +98,10 @@ class BaseplateGenerator:
                 ext_depth=self.ext_depth_mm,
                 straight_bottom=self.straight_bottom,
             )
+            # GridfinityBaseplate.cq_obj re-renders on every access unless the
+            # rendered solid is stored, so cache it up front
+            baseplate._cq_obj = baseplate.render()
+            self._baseplate = baseplate
         return self._baseplate
 
     def generate(self) -> Any:
@@ -89,13 +114,13 @@ class BaseplateGenerator:
         return baseplate.cq_obj
 
     def save_stl(self, output_path: str | Path) -> None:
-        """Save baseplate to STL file.
+        """Save baseplate to binary STL file.
 
         Args:
             output_path: Path to output STL file
         """
         baseplate = self._create_baseplate()
-        baseplate.save_stl_file(str(output_path))
+        write_binary_stl(baseplate.cq_obj, output_path)
 
     def save_step(self, output_path: str | Path) -> None:
         """Save baseplate to STEP file.
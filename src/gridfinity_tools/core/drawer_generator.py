@@ -1,6 +1,9 @@
 """Drawer solution generation module (orchestrator)."""
 
+from collections.abc import Mapping
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, NamedTuple
 
 from gridfinity_tools.core.baseplate_generator import BaseplateGenerator
@@ -14,29 +17,21 @@ from gridfinity_tools.utils.naming import (
 from gridfinity_tools.utils.splitting import (
     calculate_baseplate_units,
     calculate_split_grid,
-    calculate_total_pieces,
 )
 from gridfinity_tools.utils.validation import validate_drawer_dimensions
 
 
-class BaseplateConfig(NamedTuple):
-    """Configuration for a single baseplate piece."""
-
-    units_width: int
-    units_depth: int
-    position_x: int
-    position_y: int
-    print_count: int
-
-
 class BaseplateLayout(NamedTuple):
-    """Layout information for baseplate splitting."""
+    """Layout information for baseplate splitting.
+
+    The piece at grid position (x, y) is ``width_units_list[x]`` by
+    ``depth_units_list[y]`` units.
+    """
 
     is_split: bool
     total_pieces: int
-    width_units_list: list[int]
-    depth_units_list: list[int]
-    grid: list[list[BaseplateConfig]]
+    width_units_list: tuple[int, ...]
+    depth_units_list: tuple[int, ...]
 
 
 class DrawerSolution(NamedTuple):
@@ -47,8 +42,60 @@ class DrawerSolution(NamedTuple):
     baseplate_width_units: int
     baseplate_depth_units: int
     baseplate_layout: BaseplateLayout
-    spacer_config: dict[str, Any]
-    baseplate_config: dict[str, Any]
+    spacer_config: Mapping[str, Any]
+    baseplate_config: Mapping[str, Any]
+
+
+def _save_spacer_stl(spacer_kwargs: dict[str, Any], file_path: Path, render_mode: str) -> Path:
+    """Build a spacer and save it to STL (process pool worker).
+
+    Args:
+        spacer_kwargs: Keyword arguments for SpacerGenerator
+        file_path: Path to output STL file
+        render_mode: Rendering mode passed to SpacerGenerator.save_stl
+
+    Returns:
+        Path to saved file
+    """
+    SpacerGenerator(**spacer_kwargs).save_stl(file_path, render_mode=render_mode)
+    return file_path
+
+
+def _save_spacer_step(spacer_kwargs: dict[str, Any], file_path: Path, render_mode: str) -> Path:
+    """Build a spacer assembly and save it to STEP (process pool worker).
+
+    Args:
+        spacer_kwargs: Keyword arguments for SpacerGenerator
+        file_path: Path to output STEP file
+        render_mode: Rendering mode passed to SpacerGenerator.save_step
+
+    Returns:
+        Path to saved file
+    """
+    SpacerGenerator(**spacer_kwargs).save_step(file_path, render_mode=render_mode)
+    return file_path
+
+
+def _save_baseplate_stl(
+    units_width: int, units_depth: int, corner_screws: bool, file_path: Path
+) -> Path:
+    """Build a baseplate piece and save it to STL (process pool worker).
+
+    Args:
+        units_width: Piece width in Gridfinity units
+        units_depth: Piece depth in Gridfinity units
+        corner_screws: Add corner mounting screws
+        file_path: Path to output STL file
+
+    Returns:
+        Path to saved file
+    """
+    BaseplateGenerator(
+        units_width=units_width,
+        units_depth=units_depth,
+        corner_screws=corner_screws,
+    ).save_stl(file_path)
+    return file_path
 
 
 class DrawerGenerator:
@@ -61,6 +108,26 @@ class DrawerGenerator:
     4. Generating baseplate components (one or more pieces)
     """
 
+    __slots__ = (
+        "width_mm",
+        "depth_mm",
+        "printer_config",
+        "tolerance_mm",
+        "corner_screws",
+        "spacer_thickness_mm",
+        "chamfer_mm",
+        "show_arrows",
+        "align_features",
+        "baseplate_width_units",
+        "baseplate_depth_units",
+        "_layout",
+        "_solution",
+        "_baseplate_gens",
+        "_spacer_gen",
+        "_spacer_config",
+        "_baseplate_config",
+    )
+
     def __init__(
         self,
         width_mm: float,
@@ -101,6 +168,22 @@ class DrawerGenerator:
         self.show_arrows = show_arrows
         self.align_features = align_features
 
+        # Read-only component configurations, built once and shared by every solution
+        self._spacer_config: Mapping[str, Any] = MappingProxyType(
+            {
+                "width_mm": width_mm,
+                "depth_mm": depth_mm,
+                "thickness_mm": spacer_thickness_mm,
+                "tolerance_mm": tolerance_mm,
+                "chamfer_mm": chamfer_mm,
+                "show_arrows": show_arrows,
+                "align_features": align_features,
+            }
+        )
+        self._baseplate_config: Mapping[str, Any] = MappingProxyType(
+            {"corner_screws": corner_screws}
+        )
+
         # Calculate baseplate dimensions
         self.baseplate_width_units = calculate_baseplate_units(width_mm)
         self.baseplate_depth_units = calculate_baseplate_units(depth_mm)
@@ -109,6 +192,10 @@ class DrawerGenerator:
         self._layout: BaseplateLayout | None = None
         self._solution: DrawerSolution | None = None
 
+        # Baseplate generators keyed by piece size, shared by identical pieces
+        self._baseplate_gens: dict[tuple[int, int], BaseplateGenerator] = {}
+        self._spacer_gen: SpacerGenerator | None = None
+
     def _calculate_layout(self) -> BaseplateLayout:
         """Calculate baseplate layout with splitting if needed.
 
@@ -122,36 +209,15 @@ class DrawerGenerator:
             self.printer_config.max_depth_mm,
         )
 
-        total = calculate_total_pieces(
-            self.baseplate_width_units,
-            self.baseplate_depth_units,
-            self.printer_config.max_width_mm,
-            self.printer_config.max_depth_mm,
-        )
+        total = len(width_units_list) * len(depth_units_list)
 
         is_split = total > 1
 
-        # Build 2D grid of baseplate pieces
-        grid = []
-        for y, depth_units in enumerate(depth_units_list):
-            row = []
-            for x, width_units in enumerate(width_units_list):
-                piece = BaseplateConfig(
-                    units_width=width_units,
-                    units_depth=depth_units,
-                    position_x=x,
-                    position_y=y,
-                    print_count=1,  # Each piece prints once in grid
-                )
-                row.append(piece)
-            grid.append(row)
-
         return BaseplateLayout(
             is_split=is_split,
             total_pieces=total,
             width_units_list=width_units_list,
             depth_units_list=depth_units_list,
-            grid=grid,
         )
 
     def get_layout(self) -> BaseplateLayout:
@@ -179,22 +245,47 @@ class DrawerGenerator:
                 baseplate_width_units=self.baseplate_width_units,
                 baseplate_depth_units=self.baseplate_depth_units,
                 baseplate_layout=layout,
-                spacer_config={
-                    "width_mm": self.width_mm,
-                    "depth_mm": self.depth_mm,
-                    "thickness_mm": self.spacer_thickness_mm,
-                    "tolerance_mm": self.tolerance_mm,
-                    "chamfer_mm": self.chamfer_mm,
-                    "show_arrows": self.show_arrows,
-                    "align_features": self.align_features,
-                },
-                baseplate_config={
-                    "corner_screws": self.corner_screws,
-                },
+                spacer_config=self._spacer_config,
+                baseplate_config=self._baseplate_config,
             )
 
         return self._solution
 
+    def _get_spacer_gen(self) -> SpacerGenerator:
+        """Get spacer generator (lazy initialization).
+
+        All spacer outputs share one generator, so the spacer geometry is only
+        built again when a different render mode is requested.
+
+        Returns:
+            SpacerGenerator for the drawer
+        """
+        if self._spacer_gen is None:
+            self._spacer_gen = SpacerGenerator(**self._spacer_config)
+        return self._spacer_gen
+
+    def _get_baseplate_gen(self, units_width: int, units_depth: int) -> BaseplateGenerator:
+        """Get baseplate generator for a piece size (cached per size).
+
+        Split layouts often contain several pieces of the same size; reusing
+        the generator means their geometry is only built once.
+
+        Args:
+            units_width: Piece width in Gridfinity units
+            units_depth: Piece depth in Gridfinity units
+
+        Returns:
+            BaseplateGenerator for the piece size
+        """
+        key = (units_width, units_depth)
+        if key not in self._baseplate_gens:
+            self._baseplate_gens[key] = BaseplateGenerator(
+                units_width=units_width,
+                units_depth=units_depth,
+                corner_screws=self.corner_screws,
+            )
+        return self._baseplate_gens[key]
+
     def generate_spacer(self, render_mode: str = "half_set") -> Any:
         """Generate spacer component.
 
@@ -204,15 +295,7 @@ class DrawerGenerator:
         Returns:
             CadQuery object for the spacer
         """
-        spacer_gen = SpacerGenerator(
-            width_mm=self.width_mm,
-            depth_mm=self.depth_mm,
-            thickness_mm=self.spacer_thickness_mm,
-            tolerance_mm=self.tolerance_mm,
-            chamfer_mm=self.chamfer_mm,
-            show_arrows=self.show_arrows,
-            align_features=self.align_features,
-        )
+        spacer_gen = self._get_spacer_gen()
 
         if render_mode == "half_set":
             return spacer_gen.generate_half_set()
@@ -223,21 +306,67 @@ class DrawerGenerator:
         else:
             raise ValueError(f"Invalid render_mode: {render_mode}")
 
-    def generate_baseplate_piece(self, piece_config: BaseplateConfig) -> Any:
+    def generate_baseplate_piece(self, units_width: int, units_depth: int) -> Any:
         """Generate a single baseplate piece.
 
         Args:
-            piece_config: Configuration for the piece
+            units_width: Piece width in Gridfinity units
+            units_depth: Piece depth in Gridfinity units
 
         Returns:
             CadQuery object for the baseplate piece
         """
-        baseplate_gen = BaseplateGenerator(
-            units_width=piece_config.units_width,
-            units_depth=piece_config.units_depth,
+        return self._get_baseplate_gen(units_width, units_depth).generate()
+
+    def _spacer_half_set_filename(self) -> str:
+        """Get filename for the spacer half-set STL."""
+        return generate_spacer_filename(
+            width_mm=self.width_mm,
+            depth_mm=self.depth_mm,
+            tolerance=self.tolerance_mm,
+            render_mode="half_set",
+            file_format="stl",
+        )
+
+    def _spacer_assembly_filename(self) -> str:
+        """Get filename for the spacer full assembly STEP."""
+        return generate_assembly_filename(
+            width_mm=self.width_mm,
+            depth_mm=self.depth_mm,
+            tolerance=self.tolerance_mm,
+            file_format="step",
+        )
+
+    def _baseplate_piece_filename(self, units_width: int, units_depth: int) -> str:
+        """Get filename for a baseplate piece STL."""
+        return generate_baseplate_filename(
+            width_mm=self.width_mm,
+            depth_mm=self.depth_mm,
+            units_width=units_width,
+            units_depth=units_depth,
             corner_screws=self.corner_screws,
+            file_format="stl",
         )
-        return baseplate_gen.generate()
+
+    def _plan_baseplate_pieces(self, output_path: Path) -> list[tuple[int, int, Path]]:
+        """Map every grid cell of the layout to its baseplate piece STL path.
+
+        Args:
+            output_path: Output directory
+
+        Returns:
+            List of (units_width, units_depth, file_path) tuples in row-major grid order
+        """
+        layout = self.get_layout()
+        return [
+            (
+                units_width,
+                units_depth,
+                output_path / self._baseplate_piece_filename(units_width, units_depth),
+            )
+            for units_depth in layout.depth_units_list
+            for units_width in layout.width_units_list
+        ]
 
     def save_spacer_half_set(self, output_dir: str | Path) -> Path:
         """Save spacer half-set to STL file.
@@ -253,25 +382,9 @@ class DrawerGenerator:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        filename = generate_spacer_filename(
-            width_mm=self.width_mm,
-            depth_mm=self.depth_mm,
-            tolerance=self.tolerance_mm,
-            render_mode="half_set",
-            file_format="stl",
-        )
-        file_path = output_path / filename
+        file_path = output_path / self._spacer_half_set_filename()
 
-        spacer_gen = SpacerGenerator(
-            width_mm=self.width_mm,
-            depth_mm=self.depth_mm,
-            thickness_mm=self.spacer_thickness_mm,
-            tolerance_mm=self.tolerance_mm,
-            chamfer_mm=self.chamfer_mm,
-            show_arrows=self.show_arrows,
-            align_features=self.align_features,
-        )
-        spacer_gen.save_stl(file_path, render_mode="half_set")
+        self._get_spacer_gen().save_stl(file_path, render_mode="half_set")
 
         return file_path
 
@@ -287,24 +400,9 @@ class DrawerGenerator:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        filename = generate_assembly_filename(
-            width_mm=self.width_mm,
-            depth_mm=self.depth_mm,
-            tolerance=self.tolerance_mm,
-            file_format="step",
-        )
-        file_path = output_path / filename
+        file_path = output_path / self._spacer_assembly_filename()
 
-        spacer_gen = SpacerGenerator(
-            width_mm=self.width_mm,
-            depth_mm=self.depth_mm,
-            thickness_mm=self.spacer_thickness_mm,
-            tolerance_mm=self.tolerance_mm,
-            chamfer_mm=self.chamfer_mm,
-            show_arrows=self.show_arrows,
-            align_features=self.align_features,
-        )
-        spacer_gen.save_step(file_path, render_mode="full_assembly")
+        self._get_spacer_gen().save_step(file_path, render_mode="full_assembly")
 
         return file_path
 
@@ -312,60 +410,127 @@ class DrawerGenerator:
         """Save baseplate piece(s) to STL files.
 
         If baseplate needs to be split, generates multiple files with piece counts.
+        Identical pieces share a filename, so each unique piece is exported once
+        and its path is repeated in the result for every grid cell it fills.
+        Writing a piece overlaps with building the next one.
 
         Args:
             output_dir: Output directory
 
         Returns:
-            List of paths to saved files
+            List of paths to saved files, one per grid cell
         """
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        layout = self.get_layout()
         saved_files = []
+        writes: dict[Path, Future[None]] = {}
 
-        # Generate each unique baseplate piece
-        for row in layout.grid:
-            for piece_config in row:
-                # Generate filename for this piece
-                filename = generate_baseplate_filename(
-                    width_mm=self.width_mm,
-                    depth_mm=self.depth_mm,
-                    units_width=piece_config.units_width,
-                    units_depth=piece_config.units_depth,
-                    corner_screws=self.corner_screws,
-                    file_format="stl",
-                )
-                file_path = output_path / filename
-
-                # Generate and save the piece
-                baseplate_gen = BaseplateGenerator(
-                    units_width=piece_config.units_width,
-                    units_depth=piece_config.units_depth,
-                    corner_screws=self.corner_screws,
-                )
-                baseplate_gen.save_stl(file_path)
+        # Pieces are built on this thread and meshed/written on a writer thread,
+        # so the STL export of one piece overlaps the CAD build of the next
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            for units_width, units_depth, file_path in self._plan_baseplate_pieces(output_path):
+                if file_path not in writes:
+                    baseplate_gen = self._get_baseplate_gen(units_width, units_depth)
+                    baseplate_gen.generate()
+                    writes[file_path] = writer.submit(baseplate_gen.save_stl, file_path)
 
                 saved_files.append(file_path)
 
+        # Re-raise any export error
+        for write in writes.values():
+            write.result()
+
         return saved_files
 
-    def save_all(self, output_dir: str | Path) -> dict[str, list[Path]]:
+    def save_all(
+        self,
+        output_dir: str | Path,
+        max_workers: int = 1,
+        include_assembly: bool = True,
+    ) -> dict[str, list[Path]]:
         """Save all components (spacers and baseplates) to output directory.
 
+        With ``max_workers`` greater than 1, the spacer and baseplate files are
+        built in parallel worker processes, since each CAD build is independent
+        and single-threaded.
+
         Args:
             output_dir: Output directory
+            max_workers: Number of worker processes (default: 1, no parallelism)
+            include_assembly: Also save the spacer full assembly STEP reference file,
+                the slowest output to generate (default: True)
 
         Returns:
             Dictionary with keys "spacers" and "baseplates" containing lists of saved paths
         """
         output_path = Path(output_dir)
 
+        if max_workers > 1:
+            return self._save_all_parallel(output_path, max_workers, include_assembly)
+
+        spacers = [self.save_spacer_half_set(output_path)]
+        if include_assembly:
+            spacers.append(self.save_spacer_full_assembly(output_path))
+
         return {
-            "spacers": [
-                self.save_spacer_half_set(output_path),
-                self.save_spacer_full_assembly(output_path),
-            ],
+            "spacers": spacers,
             "baseplates": self.save_baseplate_pieces(output_path),
         }
+
+    def _save_all_parallel(
+        self, output_path: Path, max_workers: int, include_assembly: bool
+    ) -> dict[str, list[Path]]:
+        """Save all components using a process pool.
+
+        Args:
+            output_path: Output directory
+            max_workers: Number of worker processes
+            include_assembly: Also save the spacer full assembly STEP file
+
+        Returns:
+            Dictionary with keys "spacers" and "baseplates" containing lists of saved paths
+        """
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        # Plain dict: mapping proxies cannot be pickled for the worker processes
+        spacer_kwargs = dict(self._spacer_config)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            spacer_futures = [
+                executor.submit(
+                    _save_spacer_stl,
+                    spacer_kwargs,
+                    output_path / self._spacer_half_set_filename(),
+                    "half_set",
+                ),
+            ]
+            if include_assembly:
+                spacer_futures.append(
+                    executor.submit(
+                        _save_spacer_step,
+                        spacer_kwargs,
+                        output_path / self._spacer_assembly_filename(),
+                        "full_assembly",
+                    )
+                )
+            # Identical pieces share a filename, so each file is built by one job only
+            baseplate_futures: dict[Path, Future[Path]] = {}
+            baseplate_files = []
+            for units_width, units_depth, file_path in self._plan_baseplate_pieces(output_path):
+                if file_path not in baseplate_futures:
+                    baseplate_futures[file_path] = executor.submit(
+                        _save_baseplate_stl,
+                        units_width,
+                        units_depth,
+                        self.corner_screws,
+                        file_path,
+                    )
+                baseplate_files.append(file_path)
+
+            return {
+                "spacers": [future.result() for future in spacer_futures],
+                "baseplates": [
+                    baseplate_futures[file_path].result() for file_path in baseplate_files
+                ],
+            }
@@ -5,10 +5,12 @@ from dataclasses import dataclass
 from gridfinity_tools.constants import PRINTER_PRESETS
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PrinterConfig:
     """Printer build volume configuration.
 
+    Instances are immutable, so preset configs can be shared between callers.
+
     Attributes:
         name: Printer model name
         max_width_mm: Maximum print width in millimeters
@@ -21,7 +23,9 @@ class PrinterConfig:
 
     @classmethod
     def from_preset(cls, preset: str) -> "PrinterConfig":
-        """Create printer config from preset name.
+        """Get printer config for a preset name.
+
+        Preset configs are built once at import, so this is a single lookup.
 
         Args:
             preset: Preset name (e.g., "bambu-x1c", "prusa-mk4")
@@ -39,12 +43,13 @@ class PrinterConfig:
             >>> config.max_width_mm
             256
         """
-        if preset not in PRINTER_PRESETS:
-            valid = ", ".join(sorted(PRINTER_PRESETS.keys()))
-            raise ValueError(f"Unknown printer preset '{preset}', must be one of: {valid}")
-
-        name, width, depth = PRINTER_PRESETS[preset]
-        return cls(name=name, max_width_mm=width, max_depth_mm=depth)
+        try:
+            return _PRESET_CONFIGS[preset]
+        except KeyError:
+            valid = ", ".join(sorted(_PRESET_CONFIGS))
+            raise ValueError(
+                f"Unknown printer preset '{preset}', must be one of: {valid}"
+            ) from None
 
     @classmethod
     def from_custom(cls, name: str, max_width_mm: float, max_depth_mm: float) -> "PrinterConfig":
@@ -77,3 +82,9 @@ class PrinterConfig:
             'Bambu Lab X1C (256mm × 256mm)'
         """
         return f"{self.name} ({self.max_width_mm}mm × {self.max_depth_mm}mm)"
+
+
+_PRESET_CONFIGS: dict[str, PrinterConfig] = {
+    preset: PrinterConfig(name=name, max_width_mm=width, max_depth_mm=depth)
+    for preset, (name, width, depth) in PRINTER_PRESETS.items()
+}
@@ -1,9 +1,7 @@
 """Drawer spacer generation module."""
 
 from pathlib import Path
-from typing import Any
-
-from cqgridfinity import GridfinityDrawerSpacer
+from typing import TYPE_CHECKING, Any
 
 from gridfinity_tools.constants import (
     DEFAULT_ALIGN_FEATURES,
@@ -14,8 +12,12 @@ from gridfinity_tools.constants import (
     DEFAULT_SPACER_THICKNESS,
     DEFAULT_TOLERANCE,
 )
+from gridfinity_tools.utils.export import write_binary_stl
 from gridfinity_tools.utils.validation import validate_drawer_dimensions
 
+if TYPE_CHECKING:
+    from cqgridfinity import GridfinityDrawerSpacer
+
 
 class SpacerGenerator:
     """Generate drawer spacer components.
@@ -24,6 +26,21 @@ class SpacerGenerator:
     and provides an interface for generating spacer components for custom drawers.
     """
 
+    __slots__ = (
+        "width_mm",
+        "depth_mm",
+        "thickness_mm",
+        "tolerance_mm",
+        "chamfer_mm",
+        "show_arrows",
+        "align_features",
+        "align_tolerance_mm",
+        "min_margin_mm",
+        "verbose",
+        "_spacer",
+        "_rendered_mode",
+    )
+
     def __init__(
         self,
         width_mm: float,
@@ -69,14 +86,20 @@ class SpacerGenerator:
 
         # Create the underlying spacer object
         self._spacer: GridfinityDrawerSpacer | None = None
+        # Layout currently held by the spacer's cq_obj, so repeat renders are skipped
+        self._rendered_mode: str | None = None
 
-    def _create_spacer(self) -> GridfinityDrawerSpacer:
+    def _create_spacer(self) -> "GridfinityDrawerSpacer":
         """Create the underlying GridfinityDrawerSpacer object (lazy initialization).
 
         Returns:
             GridfinityDrawerSpacer instance
         """
         if self._spacer is None:
+            # Deferred import: cqgridfinity pulls in CadQuery/OCCT, which takes
+            # seconds to load and is only needed once geometry is built
+            from cqgridfinity import GridfinityDrawerSpacer
+
             self._spacer = GridfinityDrawerSpacer(
                 self.width_mm,
                 self.depth_mm,
@@ -100,7 +123,9 @@ class SpacerGenerator:
             CadQuery object representing the half set
         """
         spacer = self._create_spacer()
-        spacer.render_half_set()
+        if self._rendered_mode != "half_set":
+            spacer.render_half_set()
+            self._rendered_mode = "half_set"
         return spacer.cq_obj
 
     def generate_full_set(self) -> Any:
@@ -110,7 +135,9 @@ class SpacerGenerator:
             CadQuery object representing the full set
         """
         spacer = self._create_spacer()
-        spacer.render_full_set()
+        if self._rendered_mode != "full_set":
+            spacer.render_full_set()
+            self._rendered_mode = "full_set"
         return spacer.cq_obj
 
     def generate_full_assembly(self, include_baseplate: bool = True) -> Any:
@@ -122,12 +149,16 @@ class SpacerGenerator:
         Returns:
             CadQuery object representing the full assembly
         """
+        # Without the baseplate the assembly is the same geometry as the full set
+        mode = "full_assembly" if include_baseplate else "full_set"
         spacer = self._create_spacer()
-        spacer.render_full_set(include_baseplate=include_baseplate)
+        if self._rendered_mode != mode:
+            spacer.render_full_set(include_baseplate=include_baseplate)
+            self._rendered_mode = mode
         return spacer.cq_obj
 
     def save_stl(self, output_path: str | Path, render_mode: str = "half_set") -> None:
-        """Save spacer components to STL file.
+        """Save spacer components to binary STL file.
 
         Args:
             output_path: Path to output STL file
@@ -137,14 +168,13 @@ class SpacerGenerator:
             ValueError: If render_mode is invalid
         """
         if render_mode == "half_set":
-            self.generate_half_set()
+            cq_obj = self.generate_half_set()
         elif render_mode == "full_set":
-            self.generate_full_set()
+            cq_obj = self.generate_full_set()
         else:
             raise ValueError(f"Invalid render_mode: {render_mode}")
 
-        spacer = self._create_spacer()
-        spacer.save_stl_file(str(output_path))
+        write_binary_stl(cq_obj, output_path)
 
     def save_step(self, output_path: str | Path, render_mode: str = "full_assembly") -> None:
         """Save spacer assembly to STEP file.
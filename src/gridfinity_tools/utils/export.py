@@ -0,0 +1,53 @@
+"""CAD file export utilities."""
+
+from pathlib import Path
+from typing import Any
+
+from gridfinity_tools.constants import DEFAULT_STL_ANGULAR_TOLERANCE, DEFAULT_STL_TOLERANCE
+
+
+def ensure_output_dir(output_dir: str | Path) -> Path:
+    """Resolve an output directory once and make sure it exists.
+
+    Args:
+        output_dir: Output directory path (str or Path)
+
+    Returns:
+        Absolute Path to the existing output directory
+    """
+    output_path = Path(output_dir).resolve()
+    output_path.mkdir(parents=True, exist_ok=True)
+    return output_path
+
+
+def write_binary_stl(
+    cq_obj: Any,
+    output_path: str | Path,
+    tolerance: float = DEFAULT_STL_TOLERANCE,
+    angular_tolerance: float = DEFAULT_STL_ANGULAR_TOLERANCE,
+) -> None:
+    """Mesh a CadQuery object and write it as a binary STL file.
+
+    cqgridfinity's ``save_stl_file`` writes ASCII STL, which is about five
+    times larger and much slower to write than the binary format. This uses
+    the same mesh settings but writes binary STL.
+
+    Args:
+        cq_obj: CadQuery Workplane holding the solid to export
+        output_path: Path to output STL file
+        tolerance: Linear mesh deflection, relative to edge size (default: 0.01)
+        angular_tolerance: Angular mesh deflection in radians (default: 0.1)
+
+    Raises:
+        OSError: If the STL file cannot be written
+    """
+    written = cq_obj.val().exportStl(
+        str(output_path),
+        tolerance=tolerance,
+        angularTolerance=angular_tolerance,
+        ascii=False,
+        relative=True,
+        parallel=True,
+    )
+    if not written:
+        raise OSError(f"Failed to write STL file '{output_path}'")
@@ -1,8 +1,12 @@
 """Filename generation utilities."""
 
+from functools import lru_cache
 from pathlib import Path
 
+from gridfinity_tools.constants import DEFAULT_TOLERANCE
 
+
+@lru_cache(maxsize=1024, typed=True)
 def generate_spacer_filename(
     width_mm: float,
     depth_mm: float,
@@ -12,6 +16,9 @@ def generate_spacer_filename(
 ) -> str:
     """Generate spacer filename with relevant parameters.
 
+    Filenames are cached per argument set (typed, so ``2`` and ``2.0`` stay
+    distinct), as the same names are requested for every output of a drawer.
+
     Args:
         width_mm: Drawer width in millimeters
         depth_mm: Drawer depth in millimeters
@@ -28,22 +35,14 @@ def generate_spacer_filename(
         >>> generate_spacer_filename(330, 340, 0.5, "half_set", "stl")
         'drawer_330x340_tol0.5_spacer_half_set.stl'
     """
-    width_int = int(width_mm)
-    depth_int = int(depth_mm)
-
-    # Build base filename
-    filename = f"drawer_{width_int}x{depth_int}"
-
-    # Add tolerance if not default (1.0)
-    if tolerance != 1.0:
-        filename += f"_tol{tolerance}"
-
-    # Add render mode and format
-    filename += f"_spacer_{render_mode}.{file_format}"
-
-    return filename
+    # Add tolerance only if not default (1.0)
+    tolerance_part = f"_tol{tolerance}" if tolerance != DEFAULT_TOLERANCE else ""
+    return (
+        f"drawer_{int(width_mm)}x{int(depth_mm)}{tolerance_part}_spacer_{render_mode}.{file_format}"
+    )
 
 
+@lru_cache(maxsize=1024, typed=True)
 def generate_baseplate_filename(
     width_mm: float,
     depth_mm: float,
@@ -52,7 +51,7 @@ def generate_baseplate_filename(
     corner_screws: bool,
     file_format: str,
 ) -> str:
-    """Generate baseplate filename with relevant parameters.
+    """Generate baseplate filename with relevant parameters (cached).
 
     Args:
         width_mm: Drawer width in millimeters
@@ -71,29 +70,22 @@ def generate_baseplate_filename(
         >>> generate_baseplate_filename(330, 340, 7, 8, True, "stl")
         'drawer_330x340_screws_baseplate_7x8.stl'
     """
-    width_int = int(width_mm)
-    depth_int = int(depth_mm)
-
-    # Build base filename
-    filename = f"drawer_{width_int}x{depth_int}"
-
     # Add corner screws indicator if present
-    if corner_screws:
-        filename += "_screws"
-
-    # Add baseplate dimensions and format
-    filename += f"_baseplate_{units_width}x{units_depth}.{file_format}"
-
-    return filename
+    screws_part = "_screws" if corner_screws else ""
+    return (
+        f"drawer_{int(width_mm)}x{int(depth_mm)}{screws_part}"
+        f"_baseplate_{units_width}x{units_depth}.{file_format}"
+    )
 
 
+@lru_cache(maxsize=1024, typed=True)
 def generate_assembly_filename(
     width_mm: float,
     depth_mm: float,
     tolerance: float,
     file_format: str,
 ) -> str:
-    """Generate assembly filename with relevant parameters.
+    """Generate assembly filename with relevant parameters (cached).
 
     Args:
         width_mm: Drawer width in millimeters
@@ -110,20 +102,9 @@ def generate_assembly_filename(
         >>> generate_assembly_filename(330, 340, 0.5, "step")
         'drawer_330x340_tol0.5_full_assembly.step'
     """
-    width_int = int(width_mm)
-    depth_int = int(depth_mm)
-
-    # Build base filename
-    filename = f"drawer_{width_int}x{depth_int}"
-
-    # Add tolerance if not default (1.0)
-    if tolerance != 1.0:
-        filename += f"_tol{tolerance}"
-
-    # Add assembly and format
-    filename += f"_full_assembly.{file_format}"
-
-    return filename
+    # Add tolerance only if not default (1.0)
+    tolerance_part = f"_tol{tolerance}" if tolerance != DEFAULT_TOLERANCE else ""
+    return f"drawer_{int(width_mm)}x{int(depth_mm)}{tolerance_part}_full_assembly.{file_format}"
 
 
 def add_path_to_filename(filename: str, output_dir: Path | str) -> Path:
@@ -142,5 +123,5 @@ def add_path_to_filename(filename: str, output_dir: Path | str) -> Path:
         >>> add_path_to_filename("test.stl", Path("output"))
         PosixPath('output/test.stl')
     """
-    output_path = Path(output_dir)
-    return output_path / filename
+    # One constructor call; Path(output_dir) / filename would build an intermediate Path
+    return Path(output_dir, filename)
@@ -1,7 +1,52 @@
 """Unit conversion utilities."""
 
+import math
+from functools import lru_cache
+
 from gridfinity_tools.constants import MM_PER_INCH
 
+# Length of one unit in millimeters, keyed by unit name
+_MM_PER_UNIT: dict[str, float] = {
+    "mm": 1.0,
+    "in": MM_PER_INCH,
+}
+
+# Every casing of the inch suffix, so parse_dimension needs no lower() call
+_INCH_SUFFIXES = ("in", "In", "iN", "IN")
+
+
+def convert(value: float, from_unit: str, to_unit: str) -> float:
+    """Convert a measurement between length units.
+
+    Args:
+        value: Measurement in ``from_unit``
+        from_unit: Source unit ("mm" or "in")
+        to_unit: Target unit ("mm" or "in")
+
+    Returns:
+        Measurement in ``to_unit``
+
+    Raises:
+        ValueError: If either unit is not recognized
+
+    Examples:
+        >>> convert(1.0, "in", "mm")
+        25.4
+        >>> convert(25.4, "mm", "in")
+        1.0
+    """
+    try:
+        from_mm = _MM_PER_UNIT[from_unit]
+        to_mm = _MM_PER_UNIT[to_unit]
+    except KeyError as e:
+        valid = ", ".join(_MM_PER_UNIT)
+        raise ValueError(f"Unknown unit '{e.args[0]}', must be one of: {valid}") from None
+
+    if from_unit == to_unit:
+        return value
+    # Multiply then divide, so mm <-> in matches inches_to_mm / mm_to_inches exactly
+    return value * from_mm / to_mm
+
 
 def inches_to_mm(inches: float) -> float:
     """Convert inches to millimeters.
@@ -39,10 +84,12 @@ def mm_to_inches(mm: float) -> float:
     return mm / MM_PER_INCH
 
 
+@lru_cache(maxsize=256)
 def parse_dimension(dim_str: str) -> float:
     """Parse dimension string to millimeters.
 
-    Supports plain numbers (assumed to be mm) and inch suffixes.
+    Supports plain numbers (assumed to be mm) and inch suffixes. Results are
+    cached, since the same dimension strings tend to be parsed repeatedly.
 
     Args:
         dim_str: Dimension string like "330", "11.5in", "20.5in"
@@ -61,27 +108,25 @@ def parse_dimension(dim_str: str) -> float:
         >>> parse_dimension("1.0in")
         25.4
     """
-    dim_str = dim_str.strip().lower()
-
-    # Handle inch suffix
-    if dim_str.endswith("in"):
-        try:
-            inches = float(dim_str[:-2])
-            if inches <= 0:
-                raise ValueError(f"Dimension must be positive, got: {inches} inches")
-            return inches_to_mm(inches)
-        except ValueError as e:
-            if "positive" in str(e):
-                raise
-            raise ValueError(f"Invalid inch dimension format: {dim_str}") from e
-
-    # Handle plain number (millimeters)
+    dim_str = dim_str.strip()
+
+    # Only the suffix is case-insensitive; float() handles the number as-is
+    is_inches = dim_str.endswith(_INCH_SUFFIXES)
+    number = dim_str[:-2] if is_inches else dim_str
+
     try:
-        mm = float(dim_str)
-        if mm <= 0:
-            raise ValueError(f"Dimension must be positive, got: {mm} mm")
-        return mm
-    except ValueError as e:
-        if "positive" in str(e):
-            raise
-        raise ValueError(f"Invalid dimension format: {dim_str}") from e
+        value = float(number)
+    except ValueError:
+        value = math.nan
+
+    # float() also accepts "nan" and "inf", which are not valid dimensions
+    if not math.isfinite(value):
+        if is_inches:
+            raise ValueError(f"Invalid inch dimension format: {dim_str}")
+        raise ValueError(f"Invalid dimension format: {dim_str}")
+
+    if value <= 0:
+        unit = "inches" if is_inches else "mm"
+        raise ValueError(f"Dimension must be positive, got: {value} {unit}")
+
+    return inches_to_mm(value) if is_inches else value
@@ -1,5 +1,7 @@
 """Input validation utilities."""
 
+from collections.abc import Set
+
 from gridfinity_tools.constants import GRIDFINITY_UNIT
 
 
@@ -41,11 +43,15 @@ def validate_drawer_dimensions(width_mm: float, depth_mm: float) -> None:
             ...
         ValueError: drawer width must be positive, got 0.0
     """
+    min_size = GRIDFINITY_UNIT
+    # Anything that fits one unit is also positive, so valid input passes here
+    if width_mm >= min_size and depth_mm >= min_size:
+        return
+
     validate_positive(width_mm, "drawer width")
     validate_positive(depth_mm, "drawer depth")
 
     # Warn if drawer is too small to fit even 1 unit
-    min_size = GRIDFINITY_UNIT
     if width_mm < min_size or depth_mm < min_size:
         raise ValueError(
             f"Drawer must be at least {min_size}mm in both dimensions "
@@ -92,8 +98,8 @@ def validate_tolerance(tolerance_mm: float) -> None:
             ...
         ValueError: tolerance must be positive, got -0.5
     """
-    validate_positive(tolerance_mm, "tolerance")
-
+    if tolerance_mm <= 0:
+        raise ValueError(f"tolerance must be positive, got {tolerance_mm}")
     if tolerance_mm > 5.0:
         raise ValueError(f"tolerance should be reasonable (0.1-2.0mm), got {tolerance_mm}mm")
 
@@ -122,12 +128,12 @@ def validate_printer_dimensions(max_width_mm: float, max_depth_mm: float) -> Non
         raise ValueError(f"printer max_depth must be at least {min_size}mm, got {max_depth_mm}mm")
 
 
-def validate_file_format(file_format: str, valid_formats: set[str]) -> None:
+def validate_file_format(file_format: str, valid_formats: Set[str]) -> None:
     """Validate file format is supported.
 
     Args:
-        file_format: File format to validate
-        valid_formats: Set of valid format strings
+        file_format: File format to validate (case-insensitive)
+        valid_formats: Set or frozenset of lowercase format strings, e.g. VALID_FORMATS
 
     Raises:
         ValueError: If format is not supported
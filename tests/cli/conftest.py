@@ -0,0 +1,13 @@
+"""Shared fixtures for CLI tests."""
+
+import pytest
+from click.testing import CliRunner
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    """Provide a CliRunner shared by all CLI tests.
+
+    CliRunner keeps no state between invoke() calls, so one instance is enough.
+    """
+    return CliRunner()
@@ -1,8 +1,10 @@
 """Tests for baseplate CLI command."""
 
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
 from click.testing import CliRunner
 
 from gridfinity_tools.cli.baseplate import baseplate_command
@@ -11,68 +13,56 @@ from gridfinity_tools.cli.baseplate import baseplate_command
 class TestBaseplateCommandBasic:
     """Tests for basic baseplate command execution."""
 
-    def test_baseplate_command_help(self) -> None:
+    mock_gen_class: MagicMock
+    mock_instance: MagicMock
+
+    @pytest.fixture(autouse=True)
+    def _mock_generator(self) -> Iterator[None]:
+        """Patch BaseplateGenerator for every test in the class."""
+        with patch("gridfinity_tools.cli.baseplate.BaseplateGenerator") as mock_gen_class:
+            self.mock_gen_class = mock_gen_class
+            self.mock_instance = mock_gen_class.return_value
+            yield
+
+    def test_baseplate_command_help(self, runner: CliRunner) -> None:
         """Test baseplate command help text."""
-        runner = CliRunner()
         result = runner.invoke(baseplate_command, ["--help"])
 
         assert result.exit_code == 0
         assert "Gridfinity baseplate" in result.output
 
-    @patch("gridfinity_tools.cli.baseplate.BaseplateGenerator")
-    def test_baseplate_command_basic(self, mock_gen_class: MagicMock, tmp_path: Path) -> None:
+    def test_baseplate_command_basic(self, tmp_path: Path, runner: CliRunner) -> None:
         """Test basic baseplate command execution."""
-        mock_instance = MagicMock()
-        mock_gen_class.return_value = mock_instance
-
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(baseplate_command, ["7", "8"])
+        result = runner.invoke(baseplate_command, ["7", "8", "-o", str(tmp_path)])
 
         assert result.exit_code == 0
         assert "✨ Generation complete!" in result.output
         assert "Baseplate dimensions: 7×8 units (294×336 mm)" in result.output
-        mock_instance.save_stl.assert_called_once()
+        self.mock_instance.save_stl.assert_called_once()
 
-    @patch("gridfinity_tools.cli.baseplate.BaseplateGenerator")
-    def test_baseplate_command_step_format(self, mock_gen_class: MagicMock) -> None:
+    def test_baseplate_command_step_format(self, tmp_path: Path, runner: CliRunner) -> None:
         """Test baseplate command with STEP format."""
-        mock_instance = MagicMock()
-        mock_gen_class.return_value = mock_instance
-
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(baseplate_command, ["7", "8", "-f", "step"])
+        result = runner.invoke(baseplate_command, ["7", "8", "-f", "step", "-o", str(tmp_path)])
 
         assert result.exit_code == 0
-        mock_instance.save_step.assert_called_once()
+        self.mock_instance.save_step.assert_called_once()
 
-    @patch("gridfinity_tools.cli.baseplate.BaseplateGenerator")
-    def test_baseplate_command_svg_format(self, mock_gen_class: MagicMock) -> None:
+    def test_baseplate_command_svg_format(self, tmp_path: Path, runner: CliRunner) -> None:
         """Test baseplate command with SVG format."""
-        mock_instance = MagicMock()
-        mock_gen_class.return_value = mock_instance
-
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(baseplate_command, ["7", "8", "-f", "svg"])
+        result = runner.invoke(baseplate_command, ["7", "8", "-f", "svg", "-o", str(tmp_path)])
 
         assert result.exit_code == 0
-        mock_instance.save_svg.assert_called_once()
+        self.mock_instance.save_svg.assert_called_once()
 
-    @patch("gridfinity_tools.cli.baseplate.BaseplateGenerator")
-    def test_baseplate_command_with_corner_screws(self, mock_gen_class: MagicMock) -> None:
+    def test_baseplate_command_with_corner_screws(self, tmp_path: Path, runner: CliRunner) -> None:
         """Test baseplate command with corner screws."""
-        mock_instance = MagicMock()
-        mock_gen_class.return_value = mock_instance
-
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(baseplate_command, ["7", "8", "--corner-screws"])
+        result = runner.invoke(
+            baseplate_command, ["7", "8", "--corner-screws", "-o", str(tmp_path)]
+        )
 
         assert result.exit_code == 0
         # Verify corner_screws was passed
-        call_kwargs = mock_gen_class.call_args.kwargs
+        call_kwargs = self.mock_gen_class.call_args.kwargs
         assert call_kwargs["corner_screws"] is True
 
 
@@ -80,14 +70,11 @@ class TestBaseplateCommandOutput:
     """Tests for baseplate command output."""
 
     @patch("gridfinity_tools.cli.baseplate.BaseplateGenerator")
-    def test_baseplate_command_filename_generation(self, mock_gen_class: MagicMock) -> None:
+    def test_baseplate_command_filename_generation(
+        self, mock_gen_class: MagicMock, tmp_path: Path, runner: CliRunner
+    ) -> None:
         """Test baseplate command generates correct filenames."""
-        mock_instance = MagicMock()
-        mock_gen_class.return_value = mock_instance
-
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(baseplate_command, ["7", "8", "-f", "stl"])
+        result = runner.invoke(baseplate_command, ["7", "8", "-f", "stl", "-o", str(tmp_path)])
 
         assert result.exit_code == 0
         # Verify filename is in output
@@ -95,49 +82,44 @@ class TestBaseplateCommandOutput:
         assert ".stl" in result.output
 
     @patch("gridfinity_tools.cli.baseplate.BaseplateGenerator")
-    def test_baseplate_command_custom_output_dir(self, mock_gen_class: MagicMock) -> None:
+    def test_baseplate_command_custom_output_dir(
+        self, mock_gen_class: MagicMock, tmp_path: Path, runner: CliRunner
+    ) -> None:
         """Test baseplate command with custom output directory."""
-        mock_instance = MagicMock()
-        mock_gen_class.return_value = mock_instance
-
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(baseplate_command, ["7", "8", "-o", "my_output"])
+        result = runner.invoke(baseplate_command, ["7", "8", "-o", str(tmp_path / "my_output")])
 
-            assert result.exit_code == 0
-            assert Path("my_output").exists()
+        assert result.exit_code == 0
+        assert (tmp_path / "my_output").exists()
 
 
 class TestBaseplateCommandErrors:
     """Tests for baseplate command error handling."""
 
-    def test_baseplate_command_missing_arguments(self) -> None:
+    def test_baseplate_command_missing_arguments(self, runner: CliRunner) -> None:
         """Test baseplate command with missing arguments."""
-        runner = CliRunner()
         result = runner.invoke(baseplate_command, [])
 
         assert result.exit_code != 0
 
-    def test_baseplate_command_invalid_width(self) -> None:
+    def test_baseplate_command_invalid_width(self, runner: CliRunner) -> None:
         """Test baseplate command with invalid width."""
-        runner = CliRunner()
         result = runner.invoke(baseplate_command, ["invalid", "8"])
 
         assert result.exit_code != 0
 
-    def test_baseplate_command_zero_width(self) -> None:
+    def test_baseplate_command_zero_width(self, runner: CliRunner) -> None:
         """Test baseplate command with zero width."""
-        runner = CliRunner()
         result = runner.invoke(baseplate_command, ["0", "8"])
 
         assert result.exit_code != 0
 
     @patch("gridfinity_tools.cli.baseplate.BaseplateGenerator")
-    def test_baseplate_command_generation_error(self, mock_gen_class: MagicMock) -> None:
+    def test_baseplate_command_generation_error(
+        self, mock_gen_class: MagicMock, runner: CliRunner
+    ) -> None:
         """Test baseplate command handles generation errors."""
         mock_gen_class.side_effect = ValueError("Invalid dimensions")
 
-        runner = CliRunner()
         result = runner.invoke(baseplate_command, ["7", "8"])
 
         assert result.exit_code == 1
@@ -1,177 +1,216 @@
 """Tests for drawer CLI command."""
 
+from collections.abc import Iterator
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import click
+import pytest
 from click.testing import CliRunner
 
 from gridfinity_tools.cli.drawer import drawer_command
+from gridfinity_tools.constants import PRINTER_CHOICES
+
+
+def _solution(is_split: bool = False, total_pieces: int = 1) -> SimpleNamespace:
+    """Build a stand-in for DrawerSolution with the fields the command reads."""
+    return SimpleNamespace(
+        baseplate_width_units=7,
+        baseplate_depth_units=8,
+        baseplate_layout=SimpleNamespace(is_split=is_split, total_pieces=total_pieces),
+    )
+
+
+@pytest.fixture
+def mock_generator() -> Iterator[MagicMock]:
+    """Patch DrawerGenerator with a single-piece solution that saves no files."""
+    with patch("gridfinity_tools.cli.drawer.DrawerGenerator") as mock_gen_class:
+        mock_instance = mock_gen_class.return_value
+        mock_instance.get_solution.return_value = _solution()
+        mock_instance.save_all.return_value = {"spacers": [], "baseplates": []}
+        yield mock_gen_class
 
 
 class TestDrawerCommandBasic:
     """Tests for basic drawer command execution."""
 
-    def test_drawer_command_help(self) -> None:
+    mock_gen_class: MagicMock
+    mock_instance: MagicMock
+
+    @pytest.fixture(autouse=True)
+    def _mock_generator(self, mock_generator: MagicMock) -> None:
+        """Use the patched DrawerGenerator for every test in the class."""
+        self.mock_gen_class = mock_generator
+        self.mock_instance = mock_generator.return_value
+
+    def test_drawer_command_help(self, runner: CliRunner) -> None:
         """Test drawer command help text."""
-        runner = CliRunner()
         result = runner.invoke(drawer_command, ["--help"])
 
         assert result.exit_code == 0
         assert "Generate a complete drawer solution" in result.output
 
-    @patch("gridfinity_tools.cli.drawer.DrawerGenerator")
-    def test_drawer_command_basic(self, mock_gen_class: MagicMock, tmp_path: Path) -> None:
+    def test_drawer_command_printer_choices_from_presets(self) -> None:
+        """Test --printer accepts exactly the configured presets."""
+        param = next(p for p in drawer_command.params if p.name == "printer")
+        assert isinstance(param.type, click.Choice)
+        assert tuple(param.type.choices) == PRINTER_CHOICES
+
+    def test_drawer_command_basic(self, tmp_path: Path, runner: CliRunner) -> None:
         """Test basic drawer command execution."""
-        mock_instance = MagicMock()
-        mock_instance.get_solution.return_value = MagicMock(
-            baseplate_layout=MagicMock(is_split=False, total_pieces=1)
-        )
-        mock_instance.save_all.return_value = {
+        self.mock_instance.save_all.return_value = {
             "spacers": [tmp_path / "spacer1.stl", tmp_path / "spacer2.step"],
             "baseplates": [tmp_path / "baseplate.stl"],
         }
-        mock_gen_class.return_value = mock_instance
 
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(drawer_command, ["330", "340"])
+        result = runner.invoke(drawer_command, ["330", "340", "-o", str(tmp_path)])
 
         assert result.exit_code == 0
         assert "✨ Generation complete!" in result.output
         assert "Drawer dimensions: 330.0 × 340.0 mm" in result.output
+        assert "Baseplate dimensions: 7×8 units (294×336 mm)" in result.output
 
-    @patch("gridfinity_tools.cli.drawer.DrawerGenerator")
-    def test_drawer_command_with_options(self, mock_gen_class: MagicMock, tmp_path: Path) -> None:
+    def test_drawer_command_with_options(self, tmp_path: Path, runner: CliRunner) -> None:
         """Test drawer command with custom options."""
-        mock_instance = MagicMock()
-        mock_instance.get_solution.return_value = MagicMock(
-            baseplate_layout=MagicMock(is_split=False, total_pieces=1)
+        result = runner.invoke(
+            drawer_command,
+            [
+                "330",
+                "340",
+                "-p",
+                "prusa-mk4",
+                "-t",
+                "0.5",
+                "--corner-screws",
+                "--no-arrows",
+                "-o",
+                str(tmp_path),
+            ],
         )
-        mock_instance.save_all.return_value = {"spacers": [], "baseplates": []}
-        mock_gen_class.return_value = mock_instance
-
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(
-                drawer_command,
-                [
-                    "330",
-                    "340",
-                    "-p",
-                    "prusa-mk4",
-                    "-t",
-                    "0.5",
-                    "--corner-screws",
-                    "--no-arrows",
-                ],
-            )
 
         assert result.exit_code == 0
         # Verify options were passed to DrawerGenerator
-        call_kwargs = mock_gen_class.call_args.kwargs
+        call_kwargs = self.mock_gen_class.call_args.kwargs
         assert call_kwargs["tolerance_mm"] == 0.5
         assert call_kwargs["corner_screws"] is True
         assert call_kwargs["show_arrows"] is False
 
-    def test_drawer_command_invalid_width(self) -> None:
+    def test_drawer_command_jobs(self, tmp_path: Path, runner: CliRunner) -> None:
+        """Test drawer command passes worker count to save_all."""
+        result = runner.invoke(drawer_command, ["330", "340", "-j", "3", "-o", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert self.mock_instance.save_all.call_args.kwargs["max_workers"] == 3
+
+    def test_drawer_command_assembly_opt_in(self, tmp_path: Path, runner: CliRunner) -> None:
+        """Test STEP assembly is only requested with --assembly."""
+        default_result = runner.invoke(drawer_command, ["330", "340", "-o", str(tmp_path)])
+        default_kwargs = self.mock_instance.save_all.call_args.kwargs
+        assembly_result = runner.invoke(
+            drawer_command, ["330", "340", "--assembly", "-o", str(tmp_path)]
+        )
+        assembly_kwargs = self.mock_instance.save_all.call_args.kwargs
+
+        assert default_result.exit_code == 0
+        assert assembly_result.exit_code == 0
+        assert default_kwargs["include_assembly"] is False
+        assert assembly_kwargs["include_assembly"] is True
+
+    def test_drawer_command_invalid_width(self, runner: CliRunner) -> None:
         """Test drawer command with invalid width."""
-        runner = CliRunner()
         result = runner.invoke(drawer_command, ["invalid", "340"])
 
         assert result.exit_code != 0
 
-    def test_drawer_command_dimension_inches(self) -> None:
+    def test_drawer_command_dimension_inches(self, tmp_path: Path, runner: CliRunner) -> None:
         """Test drawer command with inches input."""
-        runner = CliRunner()
-        with (
-            runner.isolated_filesystem(),
-            patch("gridfinity_tools.cli.drawer.DrawerGenerator") as mock_gen,
-        ):
-            mock_instance = MagicMock()
-            mock_instance.get_solution.return_value = MagicMock(
-                baseplate_layout=MagicMock(is_split=False, total_pieces=1)
-            )
-            mock_instance.save_all.return_value = {"spacers": [], "baseplates": []}
-            mock_gen.return_value = mock_instance
-
-            result = runner.invoke(drawer_command, ["11.5in", "20.5in"])
-
-            assert result.exit_code == 0
-            # Verify inches were converted to mm (11.5in ≈ 291.1mm, 20.5in ≈ 520.7mm)
-            call_args = mock_gen.call_args
-            assert abs(call_args.kwargs["width_mm"] - 292.1) < 0.2
-            assert abs(call_args.kwargs["depth_mm"] - 520.7) < 0.2
+        result = runner.invoke(drawer_command, ["11.5in", "20.5in", "-o", str(tmp_path)])
+
+        assert result.exit_code == 0
+        # Verify inches were converted to mm (11.5in ≈ 291.1mm, 20.5in ≈ 520.7mm)
+        call_args = self.mock_gen_class.call_args
+        assert abs(call_args.kwargs["width_mm"] - 292.1) < 0.2
+        assert abs(call_args.kwargs["depth_mm"] - 520.7) < 0.2
 
 
 class TestDrawerCommandOutput:
     """Tests for drawer command output formatting."""
 
-    @patch("gridfinity_tools.cli.drawer.DrawerGenerator")
-    def test_drawer_command_split_warning(self, mock_gen_class: MagicMock) -> None:
+    def test_drawer_command_split_warning(
+        self, mock_generator: MagicMock, tmp_path: Path, runner: CliRunner
+    ) -> None:
         """Test drawer command shows split warning."""
-        mock_instance = MagicMock()
-        mock_instance.get_solution.return_value = MagicMock(
-            baseplate_layout=MagicMock(is_split=True, total_pieces=4)
-        )
-        mock_instance.save_all.return_value = {"spacers": [], "baseplates": []}
-        mock_gen_class.return_value = mock_instance
+        mock_instance = mock_generator.return_value
+        mock_instance.get_solution.return_value = _solution(is_split=True, total_pieces=4)
 
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(drawer_command, ["500", "500"])
+        result = runner.invoke(drawer_command, ["500", "500", "-o", str(tmp_path)])
 
         assert result.exit_code == 0
         assert "will be split into 4 pieces" in result.output
 
-    @patch("gridfinity_tools.cli.drawer.DrawerGenerator")
-    def test_drawer_command_output_directory_creation(self, mock_gen_class: MagicMock) -> None:
-        """Test drawer command creates output directory."""
-        mock_instance = MagicMock()
-        mock_instance.get_solution.return_value = MagicMock(
-            baseplate_layout=MagicMock(is_split=False, total_pieces=1)
-        )
-        mock_instance.save_all.return_value = {"spacers": [], "baseplates": []}
-        mock_gen_class.return_value = mock_instance
+    def test_drawer_command_lists_duplicate_pieces_once(
+        self, mock_generator: MagicMock, tmp_path: Path, runner: CliRunner
+    ) -> None:
+        """Test identical baseplate pieces are listed once with a print count."""
+        mock_instance = mock_generator.return_value
+        mock_instance.get_solution.return_value = _solution(is_split=True, total_pieces=3)
+        mock_instance.save_all.return_value = {
+            "spacers": [],
+            "baseplates": [
+                tmp_path / "drawer_500x500_baseplate_4x4.stl",
+                tmp_path / "drawer_500x500_baseplate_4x4.stl",
+                tmp_path / "drawer_500x500_baseplate_3x4.stl",
+            ],
+        }
 
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(drawer_command, ["330", "340", "-o", "my_output"])
+        result = runner.invoke(drawer_command, ["500", "500", "-o", str(tmp_path)])
 
-            assert result.exit_code == 0
-            assert Path("my_output").exists()
+        assert result.exit_code == 0
+        assert result.output.count("baseplate_4x4.stl") == 1
+        assert "drawer_500x500_baseplate_4x4.stl (print 2×)" in result.output
+        assert "drawer_500x500_baseplate_3x4.stl\n" in result.output
+
+    @pytest.mark.usefixtures("mock_generator")
+    def test_drawer_command_output_directory_creation(
+        self, tmp_path: Path, runner: CliRunner
+    ) -> None:
+        """Test drawer command creates output directory."""
+        result = runner.invoke(drawer_command, ["330", "340", "-o", str(tmp_path / "my_output")])
+
+        assert result.exit_code == 0
+        assert (tmp_path / "my_output").exists()
 
 
 class TestDrawerCommandErrors:
     """Tests for drawer command error handling."""
 
-    def test_drawer_command_zero_dimensions(self) -> None:
+    def test_drawer_command_zero_dimensions(self, runner: CliRunner) -> None:
         """Test drawer command with zero dimensions."""
-        runner = CliRunner()
         result = runner.invoke(drawer_command, ["0", "340"])
 
         assert result.exit_code != 0
         assert "❌ Error" in result.output
 
-    def test_drawer_command_negative_dimensions(self) -> None:
+    def test_drawer_command_negative_dimensions(self, runner: CliRunner) -> None:
         """Test drawer command with negative dimensions."""
-        runner = CliRunner()
         result = runner.invoke(drawer_command, ["-330", "340"])
 
         assert result.exit_code != 0
 
-    def test_drawer_command_invalid_printer(self) -> None:
+    def test_drawer_command_invalid_printer(self, runner: CliRunner) -> None:
         """Test drawer command with invalid printer preset."""
-        runner = CliRunner()
         result = runner.invoke(drawer_command, ["330", "340", "-p", "nonexistent"])
 
         assert result.exit_code != 0
 
     @patch("gridfinity_tools.cli.drawer.DrawerGenerator")
-    def test_drawer_command_generation_error(self, mock_gen_class: MagicMock) -> None:
+    def test_drawer_command_generation_error(
+        self, mock_gen_class: MagicMock, runner: CliRunner
+    ) -> None:
         """Test drawer command handles generation errors."""
         mock_gen_class.side_effect = ValueError("Test error")
 
-        runner = CliRunner()
         result = runner.invoke(drawer_command, ["330", "340"])
 
         assert result.exit_code == 1
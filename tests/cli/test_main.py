@@ -1,5 +1,8 @@
 """Tests for main CLI module."""
 
+import subprocess
+import sys
+
 from click.testing import CliRunner
 
 from gridfinity_tools.cli.main import cli
@@ -8,47 +11,51 @@ from gridfinity_tools.cli.main import cli
 class TestMainCLI:
     """Tests for main CLI group."""
 
-    def test_cli_help(self) -> None:
+    def test_cli_help(self, runner: CliRunner) -> None:
         """Test main CLI help text."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["--help"])
 
         assert result.exit_code == 0
         assert "Gridfinity Tools" in result.output
         assert "Commands:" in result.output
 
-    def test_cli_version(self) -> None:
+    def test_cli_version(self, runner: CliRunner) -> None:
         """Test main CLI version."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["--version"])
 
         assert result.exit_code == 0
         assert "0.1.0" in result.output
 
-    def test_cli_drawer_command_available(self) -> None:
+    def test_cli_drawer_command_available(self, runner: CliRunner) -> None:
         """Test drawer command is available in CLI group."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["--help"])
 
         assert "drawer" in result.output
 
-    def test_cli_baseplate_command_available(self) -> None:
+    def test_cli_baseplate_command_available(self, runner: CliRunner) -> None:
         """Test baseplate command is available in CLI group."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["--help"])
 
         assert "baseplate" in result.output
 
-    def test_cli_spacer_command_available(self) -> None:
+    def test_cli_spacer_command_available(self, runner: CliRunner) -> None:
         """Test spacer command is available in CLI group."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["--help"])
 
         assert "spacer" in result.output
 
-    def test_cli_invalid_command(self) -> None:
+    def test_cli_invalid_command(self, runner: CliRunner) -> None:
         """Test CLI with invalid command."""
-        runner = CliRunner()
         result = runner.invoke(cli, ["invalid"])
 
         assert result.exit_code != 0
+
+    def test_cli_import_does_not_load_cad_libraries(self) -> None:
+        """Test importing the CLI does not pull in cqgridfinity/CadQuery."""
+        code = (
+            "import sys; import gridfinity_tools.cli.main; "
+            "sys.exit('cqgridfinity' in sys.modules or 'cadquery' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], check=False)
+
+        assert result.returncode == 0
@@ -0,0 +1,20 @@
+"""Shared fixtures for core tests."""
+
+import pytest
+
+from gridfinity_tools.core.printer import PrinterConfig
+
+
+@pytest.fixture(scope="session")
+def bambu_printer() -> PrinterConfig:
+    """Provide the Bambu X1C preset shared by all core tests.
+
+    PrinterConfig is a frozen dataclass, so one instance is safe to share.
+    """
+    return PrinterConfig.from_preset("bambu-x1c")
+
+
+@pytest.fixture(scope="session")
+def small_printer() -> PrinterConfig:
+    """Provide a 200x200mm custom printer that forces larger drawers to be split."""
+    return PrinterConfig.from_custom("Small Printer", 200, 200)
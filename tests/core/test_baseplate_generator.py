@@ -1,5 +1,6 @@
 """Tests for baseplate generator."""
 
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -7,6 +8,12 @@ import pytest
 
 from gridfinity_tools.core.baseplate_generator import BaseplateGenerator
 
+# Save methods that delegate straight to a cqgridfinity file writer
+CQ_FILE_SAVES = [
+    ("save_step", "save_step_file", ".step"),
+    ("save_svg", "save_svg_file", ".svg"),
+]
+
 
 class TestBaseplateGeneratorInitialization:
     """Tests for BaseplateGenerator initialization."""
@@ -17,10 +24,21 @@ class TestBaseplateGeneratorInitialization:
         assert gen.units_width == 7
         assert gen.units_depth == 8
 
-    def test_initialization_with_corner_screws(self) -> None:
-        """Test initialization with corner screws enabled."""
-        gen = BaseplateGenerator(7, 8, corner_screws=True)
-        assert gen.corner_screws is True
+    @pytest.mark.parametrize(
+        "option,value",
+        [
+            ("corner_screws", True),
+            ("screw_hole_diam_mm", 6.0),
+            ("countersink_diam_mm", 12.0),
+            ("countersink_angle_deg", 90),
+            ("ext_depth_mm", 5.0),
+            ("straight_bottom", True),
+        ],
+    )
+    def test_initialization_with_option(self, option: str, value: object) -> None:
+        """Test each option is stored on the generator."""
+        gen = BaseplateGenerator(7, 8, **{option: value})  # type: ignore[arg-type]
+        assert getattr(gen, option) == value
 
     def test_initialization_with_defaults(self) -> None:
         """Test all defaults are set correctly."""
@@ -51,25 +69,11 @@ class TestBaseplateGeneratorInitialization:
         assert gen.ext_depth_mm == 5.0
         assert gen.straight_bottom is True
 
-    def test_invalid_zero_units_width(self) -> None:
-        """Test zero units width fails."""
-        with pytest.raises(ValueError):
-            BaseplateGenerator(0, 8)
-
-    def test_invalid_zero_units_depth(self) -> None:
-        """Test zero units depth fails."""
-        with pytest.raises(ValueError):
-            BaseplateGenerator(7, 0)
-
-    def test_invalid_negative_units_width(self) -> None:
-        """Test negative units width fails."""
+    @pytest.mark.parametrize("units_w,units_d", [(0, 8), (7, 0), (-5, 8), (7, -5)])
+    def test_invalid_units(self, units_w: int, units_d: int) -> None:
+        """Test zero or negative units in either direction fail."""
         with pytest.raises(ValueError):
-            BaseplateGenerator(-5, 8)
-
-    def test_invalid_negative_units_depth(self) -> None:
-        """Test negative units depth fails."""
-        with pytest.raises(ValueError):
-            BaseplateGenerator(7, -5)
+            BaseplateGenerator(units_w, units_d)
 
     def test_single_unit_baseplate(self) -> None:
         """Test 1x1 baseplate is valid."""
@@ -77,6 +81,13 @@ class TestBaseplateGeneratorInitialization:
         assert gen.units_width == 1
         assert gen.units_depth == 1
 
+    def test_slots_reject_unknown_attributes(self) -> None:
+        """Test generator uses __slots__ instead of a per-instance __dict__."""
+        gen = BaseplateGenerator(7, 8)
+        assert not hasattr(gen, "__dict__")
+        with pytest.raises(AttributeError):
+            gen.unknown = True  # type: ignore[attr-defined]
+
     def test_large_baseplate(self) -> None:
         """Test large baseplate is valid."""
         gen = BaseplateGenerator(13, 11)
@@ -92,137 +103,117 @@ class TestBaseplateGeneratorLazyInitialization:
         gen = BaseplateGenerator(7, 8)
         assert gen._baseplate is None
 
-    @patch("gridfinity_tools.core.baseplate_generator.GridfinityBaseplate")
+    @patch("cqgridfinity.GridfinityBaseplate")
     def test_baseplate_created_on_first_use(self, mock_baseplate_class: MagicMock) -> None:
         """Test that underlying baseplate is created on first method call."""
         gen = BaseplateGenerator(7, 8)
-        mock_instance = MagicMock()
-        mock_baseplate_class.return_value = mock_instance
-
         # Trigger creation
         gen.generate()
 
         # Verify baseplate was created
         mock_baseplate_class.assert_called_once()
 
-    @patch("gridfinity_tools.core.baseplate_generator.GridfinityBaseplate")
+    @patch("cqgridfinity.GridfinityBaseplate")
     def test_baseplate_reused_on_multiple_calls(self, mock_baseplate_class: MagicMock) -> None:
         """Test that underlying baseplate is reused on multiple calls."""
         gen = BaseplateGenerator(7, 8)
-        mock_instance = MagicMock()
-        mock_baseplate_class.return_value = mock_instance
-
         # Make multiple calls
         gen.generate()
         gen.save_stl("test.stl")
 
         # Verify baseplate was created only once
-        assert mock_baseplate_class.call_count == 1
+        mock_baseplate_class.assert_called_once()
+
+    @patch("cqgridfinity.GridfinityBaseplate")
+    def test_baseplate_rendered_once(self, mock_baseplate_class: MagicMock) -> None:
+        """Test that baseplate geometry is rendered once and reused."""
+        gen = BaseplateGenerator(7, 8)
+        mock_instance = mock_baseplate_class.return_value
+
+        gen.generate()
+        gen.save_stl("test.stl")
+        gen.save_step("test.step")
+
+        mock_instance.render.assert_called_once()
+        assert mock_instance._cq_obj is mock_instance.render.return_value
+
 
+class PatchedBaseplate:
+    """Mixin that patches GridfinityBaseplate for every test in the class."""
 
-class TestBaseplateGeneratorGeneration:
+    mock_baseplate_class: MagicMock
+    mock_instance: MagicMock
+
+    @pytest.fixture(autouse=True)
+    def _mock_baseplate(self) -> Iterator[None]:
+        """Patch GridfinityBaseplate for every test in the class."""
+        with patch("cqgridfinity.GridfinityBaseplate") as mock_baseplate_class:
+            self.mock_baseplate_class = mock_baseplate_class
+            self.mock_instance = mock_baseplate_class.return_value
+            yield
+
+
+class TestBaseplateGeneratorGeneration(PatchedBaseplate):
     """Tests for baseplate generation methods."""
 
-    @patch("gridfinity_tools.core.baseplate_generator.GridfinityBaseplate")
-    def test_generate(self, mock_baseplate_class: MagicMock) -> None:
+    def test_generate(self) -> None:
         """Test generating baseplate."""
-        mock_instance = MagicMock()
-        mock_instance.cq_obj = MagicMock()
-        mock_baseplate_class.return_value = mock_instance
-
         gen = BaseplateGenerator(7, 8)
         result = gen.generate()
 
         assert result is not None
 
 
-class TestBaseplateGeneratorFileOutput:
+class TestBaseplateGeneratorFileOutput(PatchedBaseplate):
     """Tests for file output methods."""
 
-    @patch("gridfinity_tools.core.baseplate_generator.GridfinityBaseplate")
-    def test_save_stl(self, mock_baseplate_class: MagicMock) -> None:
+    @patch("gridfinity_tools.core.baseplate_generator.write_binary_stl")
+    def test_save_stl(self, mock_write_stl: MagicMock) -> None:
         """Test saving STL file."""
-        mock_instance = MagicMock()
-        mock_baseplate_class.return_value = mock_instance
-
         gen = BaseplateGenerator(7, 8)
         gen.save_stl("test.stl")
 
-        mock_instance.save_stl_file.assert_called_once_with("test.stl")
+        mock_write_stl.assert_called_once_with(self.mock_instance.cq_obj, "test.stl")
 
-    @patch("gridfinity_tools.core.baseplate_generator.GridfinityBaseplate")
-    def test_save_stl_with_path_object(self, mock_baseplate_class: MagicMock) -> None:
+    @patch("gridfinity_tools.core.baseplate_generator.write_binary_stl")
+    def test_save_stl_with_path_object(self, mock_write_stl: MagicMock) -> None:
         """Test saving STL with Path object."""
-        mock_instance = MagicMock()
-        mock_baseplate_class.return_value = mock_instance
-
         gen = BaseplateGenerator(7, 8)
         path = Path("output/test.stl")
         gen.save_stl(path)
 
-        mock_instance.save_stl_file.assert_called_once_with(str(path))
-
-    @patch("gridfinity_tools.core.baseplate_generator.GridfinityBaseplate")
-    def test_save_step(self, mock_baseplate_class: MagicMock) -> None:
-        """Test saving STEP file."""
-        mock_instance = MagicMock()
-        mock_baseplate_class.return_value = mock_instance
-
-        gen = BaseplateGenerator(7, 8)
-        gen.save_step("test.step")
-
-        mock_instance.save_step_file.assert_called_once_with("test.step")
-
-    @patch("gridfinity_tools.core.baseplate_generator.GridfinityBaseplate")
-    def test_save_step_with_path_object(self, mock_baseplate_class: MagicMock) -> None:
-        """Test saving STEP with Path object."""
-        mock_instance = MagicMock()
-        mock_baseplate_class.return_value = mock_instance
-
-        gen = BaseplateGenerator(7, 8)
-        path = Path("output/test.step")
-        gen.save_step(path)
-
-        mock_instance.save_step_file.assert_called_once_with(str(path))
-
-    @patch("gridfinity_tools.core.baseplate_generator.GridfinityBaseplate")
-    def test_save_svg(self, mock_baseplate_class: MagicMock) -> None:
-        """Test saving SVG file."""
-        mock_instance = MagicMock()
-        mock_baseplate_class.return_value = mock_instance
+        mock_write_stl.assert_called_once_with(self.mock_instance.cq_obj, path)
 
+    @pytest.mark.parametrize("save_method,mock_method,suffix", CQ_FILE_SAVES)
+    def test_save_file(self, save_method: str, mock_method: str, suffix: str) -> None:
+        """Test saving STEP and SVG files."""
         gen = BaseplateGenerator(7, 8)
-        gen.save_svg("test.svg")
-
-        mock_instance.save_svg_file.assert_called_once_with("test.svg")
+        getattr(gen, save_method)(f"test{suffix}")
 
-    @patch("gridfinity_tools.core.baseplate_generator.GridfinityBaseplate")
-    def test_save_svg_with_path_object(self, mock_baseplate_class: MagicMock) -> None:
-        """Test saving SVG with Path object."""
-        mock_instance = MagicMock()
-        mock_baseplate_class.return_value = mock_instance
+        getattr(self.mock_instance, mock_method).assert_called_once_with(f"test{suffix}")
 
+    @pytest.mark.parametrize("save_method,mock_method,suffix", CQ_FILE_SAVES)
+    def test_save_file_with_path_object(
+        self, save_method: str, mock_method: str, suffix: str
+    ) -> None:
+        """Test saving STEP and SVG with Path object passes a string to cqgridfinity."""
         gen = BaseplateGenerator(7, 8)
-        path = Path("output/test.svg")
-        gen.save_svg(path)
+        path = Path(f"output/test{suffix}")
+        getattr(gen, save_method)(path)
 
-        mock_instance.save_svg_file.assert_called_once_with(str(path))
+        getattr(self.mock_instance, mock_method).assert_called_once_with(str(path))
 
 
-class TestBaseplateGeneratorBaseplateCreationParams:
+class TestBaseplateGeneratorBaseplateCreationParams(PatchedBaseplate):
     """Tests for parameter passing to underlying GridfinityBaseplate."""
 
-    @patch("gridfinity_tools.core.baseplate_generator.GridfinityBaseplate")
-    def test_baseplate_params_default(self, mock_baseplate_class: MagicMock) -> None:
+    def test_baseplate_params_default(self) -> None:
         """Test default parameters passed to GridfinityBaseplate."""
-        mock_instance = MagicMock()
-        mock_baseplate_class.return_value = mock_instance
-
         gen = BaseplateGenerator(7, 8)
         gen.generate()
 
         # Check that GridfinityBaseplate was called with correct params
-        call_kwargs = mock_baseplate_class.call_args[1]
+        call_kwargs = self.mock_baseplate_class.call_args.kwargs
         assert call_kwargs["corner_screws"] is False
         assert call_kwargs["csk_hole"] == 5.0
         assert call_kwargs["csk_diam"] == 10.0
@@ -230,12 +221,8 @@ class TestBaseplateGeneratorBaseplateCreationParams:
         assert call_kwargs["ext_depth"] == 0.0
         assert call_kwargs["straight_bottom"] is False
 
-    @patch("gridfinity_tools.core.baseplate_generator.GridfinityBaseplate")
-    def test_baseplate_params_custom(self, mock_baseplate_class: MagicMock) -> None:
+    def test_baseplate_params_custom(self) -> None:
         """Test custom parameters passed to GridfinityBaseplate."""
-        mock_instance = MagicMock()
-        mock_baseplate_class.return_value = mock_instance
-
         gen = BaseplateGenerator(
             7,
             8,
@@ -249,7 +236,7 @@ class TestBaseplateGeneratorBaseplateCreationParams:
         gen.generate()
 
         # Check that GridfinityBaseplate was called with correct params
-        call_kwargs = mock_baseplate_class.call_args[1]
+        call_kwargs = self.mock_baseplate_class.call_args.kwargs
         assert call_kwargs["corner_screws"] is True
         assert call_kwargs["csk_hole"] == 6.0
         assert call_kwargs["csk_diam"] == 12.0
@@ -257,16 +244,10 @@ class TestBaseplateGeneratorBaseplateCreationParams:
         assert call_kwargs["ext_depth"] == 5.0
         assert call_kwargs["straight_bottom"] is True
 
-    @patch("gridfinity_tools.core.baseplate_generator.GridfinityBaseplate")
-    def test_baseplate_units_passed_correctly(self, mock_baseplate_class: MagicMock) -> None:
+    def test_baseplate_units_passed_correctly(self) -> None:
         """Test that units are passed correctly as positional args."""
-        mock_instance = MagicMock()
-        mock_baseplate_class.return_value = mock_instance
-
         gen = BaseplateGenerator(7, 8)
         gen.generate()
 
         # Check that positional args are correct
-        call_args = mock_baseplate_class.call_args[0]
-        assert call_args[0] == 7
-        assert call_args[1] == 8
+        assert self.mock_baseplate_class.call_args.args == (7, 8)
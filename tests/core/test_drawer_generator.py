@@ -1,51 +1,58 @@
 """Tests for drawer generator."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from gridfinity_tools.core.drawer_generator import (
-    BaseplateConfig,
     BaseplateLayout,
     DrawerGenerator,
 )
 from gridfinity_tools.core.printer import PrinterConfig
 
 
+@pytest.fixture(scope="module")
+def drawer_330x340(bambu_printer: PrinterConfig) -> DrawerGenerator:
+    """330x340mm drawer with layout and solution already computed, for read-only tests."""
+    gen = DrawerGenerator(330.0, 340.0, bambu_printer)
+    gen.get_layout()
+    gen.get_solution()
+    return gen
+
+
 class TestDrawerGeneratorInitialization:
     """Tests for DrawerGenerator initialization."""
 
-    def test_basic_initialization(self) -> None:
+    def test_basic_initialization(self, bambu_printer: PrinterConfig) -> None:
         """Test basic drawer generator initialization."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer)
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer)
         assert gen.width_mm == 330.0
         assert gen.depth_mm == 340.0
         assert gen.tolerance_mm == 1.0
 
-    def test_initialization_with_custom_tolerance(self) -> None:
-        """Test initialization with custom tolerance."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer, tolerance_mm=0.5)
-        assert gen.tolerance_mm == 0.5
-
-    def test_initialization_with_custom_thickness(self) -> None:
-        """Test initialization with custom spacer thickness."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer, spacer_thickness_mm=3.0)
-        assert gen.spacer_thickness_mm == 3.0
-
-    def test_initialization_with_corner_screws(self) -> None:
-        """Test initialization with corner screws enabled."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer, corner_screws=True)
-        assert gen.corner_screws is True
+    @pytest.mark.parametrize(
+        "option,value",
+        [
+            ("tolerance_mm", 0.5),
+            ("spacer_thickness_mm", 3.0),
+            ("corner_screws", True),
+            ("chamfer_mm", 0.5),
+            ("show_arrows", False),
+            ("align_features", False),
+        ],
+    )
+    def test_initialization_with_option(
+        self, option: str, value: object, bambu_printer: PrinterConfig
+    ) -> None:
+        """Test each option is stored on the generator."""
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer, **{option: value})  # type: ignore[arg-type]
+        assert getattr(gen, option) == value
 
-    def test_initialization_with_all_defaults(self) -> None:
+    def test_initialization_with_all_defaults(self, bambu_printer: PrinterConfig) -> None:
         """Test all defaults are set correctly."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer)
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer)
         assert gen.spacer_thickness_mm == 5.0
         assert gen.tolerance_mm == 1.0
         assert gen.chamfer_mm == 1.0
@@ -53,13 +60,12 @@ class TestDrawerGeneratorInitialization:
         assert gen.align_features is True
         assert gen.corner_screws is False
 
-    def test_initialization_with_custom_options(self) -> None:
+    def test_initialization_with_custom_options(self, bambu_printer: PrinterConfig) -> None:
         """Test initialization with multiple custom options."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
         gen = DrawerGenerator(
             330.0,
             340.0,
-            printer,
+            bambu_printer,
             tolerance_mm=0.75,
             corner_screws=True,
             spacer_thickness_mm=4.0,
@@ -74,35 +80,37 @@ class TestDrawerGeneratorInitialization:
         assert gen.show_arrows is False
         assert gen.align_features is False
 
-    def test_invalid_width_dimension(self) -> None:
-        """Test invalid width dimension fails."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        with pytest.raises(ValueError):
-            DrawerGenerator(0.0, 340.0, printer)
-
-    def test_invalid_depth_dimension(self) -> None:
-        """Test invalid depth dimension fails."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        with pytest.raises(ValueError):
-            DrawerGenerator(330.0, 0.0, printer)
-
-    def test_too_small_dimensions(self) -> None:
-        """Test dimensions smaller than 42mm fail."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
+    @pytest.mark.parametrize(
+        "width_mm,depth_mm",
+        [
+            (0.0, 340.0),
+            (330.0, 0.0),
+            (30.0, 340.0),  # smaller than one 42mm unit
+        ],
+    )
+    def test_invalid_dimensions(
+        self, width_mm: float, depth_mm: float, bambu_printer: PrinterConfig
+    ) -> None:
+        """Test zero or too-small dimensions fail."""
         with pytest.raises(ValueError):
-            DrawerGenerator(30.0, 340.0, printer)
+            DrawerGenerator(width_mm, depth_mm, bambu_printer)
 
-    def test_fractional_dimensions(self) -> None:
+    def test_fractional_dimensions(self, bambu_printer: PrinterConfig) -> None:
         """Test fractional dimensions are accepted."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(292.1, 520.7, printer)
+        gen = DrawerGenerator(292.1, 520.7, bambu_printer)
         assert gen.width_mm == 292.1
         assert gen.depth_mm == 520.7
 
-    def test_baseplate_units_calculated_on_init(self) -> None:
+    def test_slots_reject_unknown_attributes(self, bambu_printer: PrinterConfig) -> None:
+        """Test generator uses __slots__ instead of a per-instance __dict__."""
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer)
+        assert not hasattr(gen, "__dict__")
+        with pytest.raises(AttributeError):
+            gen.unknown = True  # type: ignore[attr-defined]
+
+    def test_baseplate_units_calculated_on_init(self, bambu_printer: PrinterConfig) -> None:
         """Test baseplate units are calculated during initialization."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer)
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer)
         # 330mm / 42mm per unit = 7 units
         # 340mm / 42mm per unit = 8 units
         assert gen.baseplate_width_units == 7
@@ -112,10 +120,9 @@ class TestDrawerGeneratorInitialization:
 class TestDrawerGeneratorLayout:
     """Tests for baseplate layout calculation."""
 
-    def test_layout_no_split_small_drawer(self) -> None:
+    def test_layout_no_split_small_drawer(self, bambu_printer: PrinterConfig) -> None:
         """Test layout for small drawer that fits in one piece."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(200.0, 200.0, printer)
+        gen = DrawerGenerator(200.0, 200.0, bambu_printer)
         layout = gen.get_layout()
 
         assert layout.is_split is False
@@ -123,42 +130,37 @@ class TestDrawerGeneratorLayout:
         assert len(layout.width_units_list) == 1
         assert len(layout.depth_units_list) == 1
 
-    def test_layout_grid_structure(self) -> None:
-        """Test layout grid structure is correct."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer)
+    def test_layout_grid_structure(self, small_printer: PrinterConfig) -> None:
+        """Test layout holds one unit count per grid column and row."""
+        gen = DrawerGenerator(500.0, 500.0, small_printer)
         layout = gen.get_layout()
 
-        # Grid should be 2D array
-        assert len(layout.grid) > 0
-        assert all(isinstance(row, list) for row in layout.grid)
-        assert all(isinstance(piece, BaseplateConfig) for row in layout.grid for piece in row)
+        assert layout.width_units_list == (4, 4, 3)
+        assert layout.depth_units_list == (4, 4, 3)
+        assert layout.total_pieces == len(layout.width_units_list) * len(layout.depth_units_list)
 
-    def test_layout_lazy_initialization(self) -> None:
+    def test_layout_lazy_initialization(self, bambu_printer: PrinterConfig) -> None:
         """Test layout is lazily initialized."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer)
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer)
         assert gen._layout is None
         layout1 = gen.get_layout()
         assert gen._layout is not None
         layout2 = gen.get_layout()
         assert layout1 is layout2  # Same object, not recreated
 
-    def test_layout_pieces_have_coordinates(self) -> None:
-        """Test layout pieces have position coordinates."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer)
+    def test_plan_baseplate_pieces_row_major(self, tmp_path: Path) -> None:
+        """Test planned pieces follow the layout in row-major order."""
+        printer = PrinterConfig.from_custom("Small Printer", 200, 300)
+        gen = DrawerGenerator(500.0, 400.0, printer)
         layout = gen.get_layout()
+        plan = gen._plan_baseplate_pieces(tmp_path)
 
-        for y, row in enumerate(layout.grid):
-            for x, piece in enumerate(row):
-                assert piece.position_x == x
-                assert piece.position_y == y
+        expected = [(uw, ud) for ud in layout.depth_units_list for uw in layout.width_units_list]
+        assert [(uw, ud) for uw, ud, _ in plan] == expected
 
-    def test_layout_with_custom_printer(self) -> None:
+    def test_layout_with_custom_printer(self, small_printer: PrinterConfig) -> None:
         """Test layout with custom printer constraints."""
-        printer = PrinterConfig.from_custom("Custom", 200, 200)
-        gen = DrawerGenerator(400.0, 400.0, printer)
+        gen = DrawerGenerator(400.0, 400.0, small_printer)
         layout = gen.get_layout()
 
         # Should be split due to small printer
@@ -169,58 +171,62 @@ class TestDrawerGeneratorLayout:
 class TestDrawerGeneratorSolution:
     """Tests for drawer solution generation."""
 
-    def test_solution_lazy_initialization(self) -> None:
+    def test_solution_lazy_initialization(self, bambu_printer: PrinterConfig) -> None:
         """Test solution is lazily initialized."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer)
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer)
         assert gen._solution is None
         solution1 = gen.get_solution()
         assert gen._solution is not None
         solution2 = gen.get_solution()
         assert solution1 is solution2  # Same object, not recreated
 
-    def test_solution_contains_drawer_dimensions(self) -> None:
+    def test_solution_contains_drawer_dimensions(self, drawer_330x340: DrawerGenerator) -> None:
         """Test solution contains drawer dimensions."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer)
-        solution = gen.get_solution()
+        solution = drawer_330x340.get_solution()
 
         assert solution.drawer_width_mm == 330.0
         assert solution.drawer_depth_mm == 340.0
 
-    def test_solution_contains_baseplate_units(self) -> None:
+    def test_solution_contains_baseplate_units(self, drawer_330x340: DrawerGenerator) -> None:
         """Test solution contains baseplate units."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer)
-        solution = gen.get_solution()
+        solution = drawer_330x340.get_solution()
 
         assert solution.baseplate_width_units == 7
         assert solution.baseplate_depth_units == 8
 
-    def test_solution_contains_layout(self) -> None:
+    def test_solution_contains_layout(self, drawer_330x340: DrawerGenerator) -> None:
         """Test solution contains baseplate layout."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer)
-        solution = gen.get_solution()
+        solution = drawer_330x340.get_solution()
 
         assert isinstance(solution.baseplate_layout, BaseplateLayout)
         assert solution.baseplate_layout.total_pieces > 0
 
-    def test_solution_contains_spacer_config(self) -> None:
+    def test_solution_contains_spacer_config(self, bambu_printer: PrinterConfig) -> None:
         """Test solution contains spacer configuration."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer, tolerance_mm=0.5)
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer, tolerance_mm=0.5)
+        solution = gen.get_solution()
+
+        expected = {
+            "width_mm": 330.0,
+            "depth_mm": 340.0,
+            "tolerance_mm": 0.5,
+            "thickness_mm": 5.0,
+        }
+        assert expected.items() <= solution.spacer_config.items()
+
+    def test_solution_configs_are_read_only_and_shared(self, bambu_printer: PrinterConfig) -> None:
+        """Test solution configs are built once and cannot be modified."""
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer)
         solution = gen.get_solution()
 
-        assert solution.spacer_config["width_mm"] == 330.0
-        assert solution.spacer_config["depth_mm"] == 340.0
-        assert solution.spacer_config["tolerance_mm"] == 0.5
-        assert solution.spacer_config["thickness_mm"] == 5.0
+        with pytest.raises(TypeError):
+            solution.spacer_config["width_mm"] = 1.0  # type: ignore[index]
+        gen._solution = None
+        assert gen.get_solution().spacer_config is solution.spacer_config
 
-    def test_solution_contains_baseplate_config(self) -> None:
+    def test_solution_contains_baseplate_config(self, bambu_printer: PrinterConfig) -> None:
         """Test solution contains baseplate configuration."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer, corner_screws=True)
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer, corner_screws=True)
         solution = gen.get_solution()
 
         assert solution.baseplate_config["corner_screws"] is True
@@ -229,69 +235,62 @@ class TestDrawerGeneratorSolution:
 class TestDrawerGeneratorGeneration:
     """Tests for spacer and baseplate generation methods."""
 
+    @pytest.mark.parametrize(
+        "render_mode,method,kwargs",
+        [
+            ("half_set", "generate_half_set", {}),
+            ("full_set", "generate_full_set", {}),
+            ("full_assembly", "generate_full_assembly", {"include_baseplate": False}),
+        ],
+    )
     @patch("gridfinity_tools.core.drawer_generator.SpacerGenerator")
-    def test_generate_spacer_half_set(self, mock_spacer_class: MagicMock) -> None:
-        """Test generating spacer half set."""
-        mock_instance = MagicMock()
-        mock_instance.cq_obj = MagicMock()
-        mock_spacer_class.return_value = mock_instance
-
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer)
-        gen.generate_spacer(render_mode="half_set")
+    def test_generate_spacer(
+        self,
+        mock_spacer_class: MagicMock,
+        render_mode: str,
+        method: str,
+        kwargs: dict[str, bool],
+        bambu_printer: PrinterConfig,
+    ) -> None:
+        """Test each render mode dispatches to the matching SpacerGenerator method."""
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer)
+        gen.generate_spacer(render_mode=render_mode)
 
         mock_spacer_class.assert_called_once()
-        mock_instance.generate_half_set.assert_called_once()
+        getattr(mock_spacer_class.return_value, method).assert_called_once_with(**kwargs)
 
     @patch("gridfinity_tools.core.drawer_generator.SpacerGenerator")
-    def test_generate_spacer_full_set(self, mock_spacer_class: MagicMock) -> None:
-        """Test generating spacer full set."""
-        mock_instance = MagicMock()
-        mock_instance.cq_obj = MagicMock()
-        mock_spacer_class.return_value = mock_instance
-
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer)
-        gen.generate_spacer(render_mode="full_set")
-
-        mock_instance.generate_full_set.assert_called_once()
-
-    @patch("gridfinity_tools.core.drawer_generator.SpacerGenerator")
-    def test_generate_spacer_full_assembly(self, mock_spacer_class: MagicMock) -> None:
-        """Test generating spacer full assembly."""
-        mock_instance = MagicMock()
-        mock_instance.cq_obj = MagicMock()
-        mock_spacer_class.return_value = mock_instance
-
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer)
-        gen.generate_spacer(render_mode="full_assembly")
+    def test_spacer_generator_reused(
+        self, mock_spacer_class: MagicMock, tmp_path: Path, bambu_printer: PrinterConfig
+    ) -> None:
+        """Test spacer outputs share one SpacerGenerator."""
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer)
+        gen.generate_spacer("half_set")
+        gen.save_spacer_half_set(tmp_path)
+        gen.save_spacer_full_assembly(tmp_path)
 
-        mock_instance.generate_full_assembly.assert_called_once_with(include_baseplate=False)
+        mock_spacer_class.assert_called_once()
 
     @patch("gridfinity_tools.core.drawer_generator.SpacerGenerator")
-    def test_generate_spacer_invalid_mode(self, mock_spacer_class: MagicMock) -> None:
+    def test_generate_spacer_invalid_mode(
+        self, mock_spacer_class: MagicMock, bambu_printer: PrinterConfig
+    ) -> None:
         """Test generating spacer with invalid mode fails."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer)
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer)
 
         with pytest.raises(ValueError, match="Invalid render_mode"):
             gen.generate_spacer(render_mode="invalid")
 
     @patch("gridfinity_tools.core.drawer_generator.BaseplateGenerator")
-    def test_generate_baseplate_piece(self, mock_baseplate_class: MagicMock) -> None:
+    def test_generate_baseplate_piece(
+        self, mock_baseplate_class: MagicMock, bambu_printer: PrinterConfig
+    ) -> None:
         """Test generating a single baseplate piece."""
-        mock_instance = MagicMock()
-        mock_instance.cq_obj = MagicMock()
-        mock_baseplate_class.return_value = mock_instance
+        mock_instance = mock_baseplate_class.return_value
 
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer)
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer)
 
-        piece_config = BaseplateConfig(
-            units_width=7, units_depth=8, position_x=0, position_y=0, print_count=1
-        )
-        gen.generate_baseplate_piece(piece_config)
+        gen.generate_baseplate_piece(7, 8)
 
         mock_baseplate_class.assert_called_once()
         mock_instance.generate.assert_called_once()
@@ -301,13 +300,13 @@ class TestDrawerGeneratorSave:
     """Tests for saving generated components to files."""
 
     @patch("gridfinity_tools.core.drawer_generator.SpacerGenerator")
-    def test_save_spacer_half_set(self, mock_spacer_class: MagicMock, tmp_path: Path) -> None:
+    def test_save_spacer_half_set(
+        self, mock_spacer_class: MagicMock, tmp_path: Path, bambu_printer: PrinterConfig
+    ) -> None:
         """Test saving spacer half set."""
-        mock_instance = MagicMock()
-        mock_spacer_class.return_value = mock_instance
+        mock_instance = mock_spacer_class.return_value
 
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer)
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer)
         result = gen.save_spacer_half_set(tmp_path)
 
         assert result.parent == tmp_path
@@ -317,13 +316,13 @@ class TestDrawerGeneratorSave:
         mock_instance.save_stl.assert_called_once()
 
     @patch("gridfinity_tools.core.drawer_generator.SpacerGenerator")
-    def test_save_spacer_full_assembly(self, mock_spacer_class: MagicMock, tmp_path: Path) -> None:
+    def test_save_spacer_full_assembly(
+        self, mock_spacer_class: MagicMock, tmp_path: Path, bambu_printer: PrinterConfig
+    ) -> None:
         """Test saving spacer full assembly."""
-        mock_instance = MagicMock()
-        mock_spacer_class.return_value = mock_instance
+        mock_instance = mock_spacer_class.return_value
 
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer)
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer)
         result = gen.save_spacer_full_assembly(tmp_path)
 
         assert result.parent == tmp_path
@@ -333,13 +332,11 @@ class TestDrawerGeneratorSave:
         mock_instance.save_step.assert_called_once()
 
     @patch("gridfinity_tools.core.drawer_generator.BaseplateGenerator")
-    def test_save_baseplate_pieces(self, mock_baseplate_class: MagicMock, tmp_path: Path) -> None:
+    def test_save_baseplate_pieces(
+        self, mock_baseplate_class: MagicMock, tmp_path: Path, bambu_printer: PrinterConfig
+    ) -> None:
         """Test saving baseplate pieces."""
-        mock_instance = MagicMock()
-        mock_baseplate_class.return_value = mock_instance
-
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer)
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer)
         results = gen.save_baseplate_pieces(tmp_path)
 
         assert len(results) > 0
@@ -347,19 +344,62 @@ class TestDrawerGeneratorSave:
         assert all("baseplate" in result.name for result in results)
         assert all(result.suffix == ".stl" for result in results)
 
+    @patch("gridfinity_tools.core.drawer_generator.BaseplateGenerator")
+    def test_save_baseplate_pieces_reuses_identical_pieces(
+        self, mock_baseplate_class: MagicMock, tmp_path: Path, small_printer: PrinterConfig
+    ) -> None:
+        """Test identical baseplate pieces share one generator."""
+        gen = DrawerGenerator(500.0, 500.0, small_printer)
+        results = gen.save_baseplate_pieces(tmp_path)
+
+        # 11 units split into [4, 4, 3] in both directions: 9 cells, 4 unique sizes
+        assert len(results) == 9
+        assert mock_baseplate_class.call_count == 4
+
+    def test_plan_baseplate_pieces(self, tmp_path: Path, small_printer: PrinterConfig) -> None:
+        """Test planning maps each grid cell to a path without building geometry."""
+        gen = DrawerGenerator(500.0, 500.0, small_printer)
+        plan = gen._plan_baseplate_pieces(tmp_path)
+
+        assert len(plan) == 9
+        assert all(file_path.parent == tmp_path for _, _, file_path in plan)
+        assert len({file_path for _, _, file_path in plan}) == 4
+
+    @patch("gridfinity_tools.core.drawer_generator.BaseplateGenerator")
+    def test_save_baseplate_pieces_propagates_write_errors(
+        self, mock_baseplate_class: MagicMock, tmp_path: Path, bambu_printer: PrinterConfig
+    ) -> None:
+        """Test an STL export failure on the writer thread is raised to the caller."""
+        mock_baseplate_class.return_value.save_stl.side_effect = OSError("disk full")
+
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer)
+        with pytest.raises(OSError, match="disk full"):
+            gen.save_baseplate_pieces(tmp_path)
+
+    @patch("gridfinity_tools.core.drawer_generator.BaseplateGenerator")
+    def test_save_baseplate_pieces_exports_identical_pieces_once(
+        self, mock_baseplate_class: MagicMock, tmp_path: Path, small_printer: PrinterConfig
+    ) -> None:
+        """Test each unique baseplate piece is written to STL only once."""
+        gen = DrawerGenerator(500.0, 500.0, small_printer)
+        results = gen.save_baseplate_pieces(tmp_path)
+
+        save_stl = mock_baseplate_class.return_value.save_stl
+        assert save_stl.call_count == 4
+        assert len(set(results)) == 4
+        assert {call.args[0] for call in save_stl.call_args_list} == set(results)
+
     @patch("gridfinity_tools.core.drawer_generator.SpacerGenerator")
     @patch("gridfinity_tools.core.drawer_generator.BaseplateGenerator")
     def test_save_all(
-        self, mock_baseplate_class: MagicMock, mock_spacer_class: MagicMock, tmp_path: Path
+        self,
+        mock_baseplate_class: MagicMock,
+        mock_spacer_class: MagicMock,
+        tmp_path: Path,
+        bambu_printer: PrinterConfig,
     ) -> None:
         """Test saving all components."""
-        mock_spacer_instance = MagicMock()
-        mock_baseplate_instance = MagicMock()
-        mock_spacer_class.return_value = mock_spacer_instance
-        mock_baseplate_class.return_value = mock_baseplate_instance
-
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer)
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer)
         results = gen.save_all(tmp_path)
 
         assert "spacers" in results
@@ -367,19 +407,57 @@ class TestDrawerGeneratorSave:
         assert len(results["spacers"]) == 2  # half_set and full_assembly
         assert len(results["baseplates"]) > 0
 
+    @patch("gridfinity_tools.core.drawer_generator.SpacerGenerator")
+    @patch("gridfinity_tools.core.drawer_generator.BaseplateGenerator")
+    def test_save_all_without_assembly(
+        self,
+        mock_baseplate_class: MagicMock,
+        mock_spacer_class: MagicMock,
+        tmp_path: Path,
+        bambu_printer: PrinterConfig,
+    ) -> None:
+        """Test saving all components without the STEP assembly."""
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer)
+        results = gen.save_all(tmp_path, include_assembly=False)
+
+        assert results["spacers"] == [tmp_path / "drawer_330x340_spacer_half_set.stl"]
+        mock_spacer_class.return_value.save_step.assert_not_called()
+
+    @patch("gridfinity_tools.core.drawer_generator.ProcessPoolExecutor", ThreadPoolExecutor)
+    @patch("gridfinity_tools.core.drawer_generator.SpacerGenerator")
+    @patch("gridfinity_tools.core.drawer_generator.BaseplateGenerator")
+    def test_save_all_parallel(
+        self,
+        mock_baseplate_class: MagicMock,
+        mock_spacer_class: MagicMock,
+        tmp_path: Path,
+        small_printer: PrinterConfig,
+    ) -> None:
+        """Test saving all components with multiple workers."""
+        gen = DrawerGenerator(500.0, 500.0, small_printer)
+        results = gen.save_all(tmp_path, max_workers=4)
+
+        assert results["spacers"] == [
+            tmp_path / "drawer_500x500_spacer_half_set.stl",
+            tmp_path / "drawer_500x500_full_assembly.step",
+        ]
+        assert len(results["baseplates"]) == 9
+        # Each unique piece size is built exactly once
+        assert mock_baseplate_class.call_count == 4
+        mock_spacer_class.return_value.save_stl.assert_called_once()
+        mock_spacer_class.return_value.save_step.assert_called_once()
+
     @patch("gridfinity_tools.core.drawer_generator.SpacerGenerator")
     @patch("gridfinity_tools.core.drawer_generator.BaseplateGenerator")
     def test_save_creates_output_directory(
-        self, mock_baseplate_class: MagicMock, mock_spacer_class: MagicMock, tmp_path: Path
+        self,
+        mock_baseplate_class: MagicMock,
+        mock_spacer_class: MagicMock,
+        tmp_path: Path,
+        bambu_printer: PrinterConfig,
     ) -> None:
         """Test that save methods create output directory if it doesn't exist."""
-        mock_spacer_instance = MagicMock()
-        mock_baseplate_instance = MagicMock()
-        mock_spacer_class.return_value = mock_spacer_instance
-        mock_baseplate_class.return_value = mock_baseplate_instance
-
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer)
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer)
 
         nested_output = tmp_path / "output" / "subfolder"
         gen.save_spacer_half_set(nested_output)
@@ -391,16 +469,14 @@ class TestDrawerGeneratorConfiguration:
     """Tests for configuration propagation to generators."""
 
     @patch("gridfinity_tools.core.drawer_generator.SpacerGenerator")
-    def test_spacer_config_propagation(self, mock_spacer_class: MagicMock) -> None:
+    def test_spacer_config_propagation(
+        self, mock_spacer_class: MagicMock, bambu_printer: PrinterConfig
+    ) -> None:
         """Test spacer configuration is propagated correctly."""
-        mock_instance = MagicMock()
-        mock_spacer_class.return_value = mock_instance
-
-        printer = PrinterConfig.from_preset("bambu-x1c")
         gen = DrawerGenerator(
             330.0,
             340.0,
-            printer,
+            bambu_printer,
             tolerance_mm=0.5,
             spacer_thickness_mm=3.0,
             chamfer_mm=0.8,
@@ -418,18 +494,13 @@ class TestDrawerGeneratorConfiguration:
         assert call_kwargs["align_features"] is False
 
     @patch("gridfinity_tools.core.drawer_generator.BaseplateGenerator")
-    def test_baseplate_config_propagation(self, mock_baseplate_class: MagicMock) -> None:
+    def test_baseplate_config_propagation(
+        self, mock_baseplate_class: MagicMock, bambu_printer: PrinterConfig
+    ) -> None:
         """Test baseplate configuration is propagated correctly."""
-        mock_instance = MagicMock()
-        mock_baseplate_class.return_value = mock_instance
+        gen = DrawerGenerator(330.0, 340.0, bambu_printer, corner_screws=True)
 
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(330.0, 340.0, printer, corner_screws=True)
-
-        piece_config = BaseplateConfig(
-            units_width=7, units_depth=8, position_x=0, position_y=0, print_count=1
-        )
-        gen.generate_baseplate_piece(piece_config)
+        gen.generate_baseplate_piece(7, 8)
 
         # Verify BaseplateGenerator was called with correct parameters
         call_kwargs = mock_baseplate_class.call_args.kwargs
@@ -439,42 +510,49 @@ class TestDrawerGeneratorConfiguration:
 class TestDrawerGeneratorIntegration:
     """Integration tests for complete workflows."""
 
-    def test_small_drawer_no_split_workflow(self) -> None:
-        """Test workflow for drawer that doesn't need splitting."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-        gen = DrawerGenerator(200.0, 200.0, printer)
-
-        layout = gen.get_layout()
-        solution = gen.get_solution()
-
-        assert layout.is_split is False
-        assert layout.total_pieces == 1
-        assert solution.baseplate_layout.total_pieces == 1
-
-    def test_large_drawer_with_split_workflow(self) -> None:
-        """Test workflow for drawer requiring splitting."""
-        printer = PrinterConfig.from_custom("Small Printer", 200, 200)
-        gen = DrawerGenerator(500.0, 500.0, printer)
+    @pytest.mark.parametrize(
+        "printer_fixture,width_mm,depth_mm,is_split,total_pieces",
+        [
+            ("bambu_printer", 200.0, 200.0, False, 1),
+            ("small_printer", 500.0, 500.0, True, 9),
+        ],
+    )
+    def test_layout_and_solution_workflow(
+        self,
+        request: pytest.FixtureRequest,
+        printer_fixture: str,
+        width_mm: float,
+        depth_mm: float,
+        is_split: bool,
+        total_pieces: int,
+    ) -> None:
+        """Test drawers that fit in one piece and drawers that need splitting."""
+        printer = request.getfixturevalue(printer_fixture)
+        gen = DrawerGenerator(width_mm, depth_mm, printer)
 
         layout = gen.get_layout()
         solution = gen.get_solution()
 
-        assert layout.is_split is True
-        assert layout.total_pieces > 1
-        assert solution.baseplate_layout.total_pieces > 1
-
-    def test_multiple_drawer_configs(self) -> None:
-        """Test creating multiple drawer configurations."""
-        printer = PrinterConfig.from_preset("bambu-x1c")
-
-        gen1 = DrawerGenerator(300.0, 300.0, printer)
-        gen2 = DrawerGenerator(250.0, 250.0, printer)
-        gen3 = DrawerGenerator(400.0, 400.0, printer)
-
-        solution1 = gen1.get_solution()
-        solution2 = gen2.get_solution()
-        solution3 = gen3.get_solution()
+        assert layout.is_split is is_split
+        assert layout.total_pieces == total_pieces
+        assert solution.baseplate_layout is layout
+
+    @pytest.mark.parametrize(
+        "width_mm,depth_mm,expected_width_units",
+        [
+            (300.0, 300.0, 7),
+            (250.0, 250.0, 5),
+            (400.0, 400.0, 9),
+        ],
+    )
+    def test_multiple_drawer_configs(
+        self,
+        width_mm: float,
+        depth_mm: float,
+        expected_width_units: int,
+        bambu_printer: PrinterConfig,
+    ) -> None:
+        """Test several drawer sizes against the same printer."""
+        solution = DrawerGenerator(width_mm, depth_mm, bambu_printer).get_solution()
 
-        assert solution1.baseplate_width_units == 7
-        assert solution2.baseplate_width_units == 5
-        assert solution3.baseplate_width_units == 9
+        assert solution.baseplate_width_units == expected_width_units
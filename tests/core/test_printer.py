@@ -1,47 +1,36 @@
 """Tests for printer configuration."""
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 
+from gridfinity_tools.constants import PRINTER_CHOICES, PRINTER_PRESETS
 from gridfinity_tools.core.printer import PrinterConfig
 
 
 class TestPrinterConfigFromPreset:
     """Tests for PrinterConfig.from_preset class method."""
 
-    def test_bambu_x1c_preset(self) -> None:
-        """Test loading Bambu Lab X1C preset."""
-        config = PrinterConfig.from_preset("bambu-x1c")
-        assert config.name == "Bambu Lab X1C"
-        assert config.max_width_mm == 256
-        assert config.max_depth_mm == 256
-
-    def test_bambu_p1p_preset(self) -> None:
-        """Test loading Bambu Lab P1P preset."""
-        config = PrinterConfig.from_preset("bambu-p1p")
-        assert config.name == "Bambu Lab P1P"
-        assert config.max_width_mm == 256
-        assert config.max_depth_mm == 256
-
-    def test_prusa_mk4_preset(self) -> None:
-        """Test loading Prusa MK4 preset."""
-        config = PrinterConfig.from_preset("prusa-mk4")
-        assert config.name == "Prusa MK4"
-        assert config.max_width_mm == 250
-        assert config.max_depth_mm == 210
-
-    def test_prusa_mini_preset(self) -> None:
-        """Test loading Prusa Mini preset."""
-        config = PrinterConfig.from_preset("prusa-mini")
-        assert config.name == "Prusa Mini"
-        assert config.max_width_mm == 180
-        assert config.max_depth_mm == 180
-
-    def test_ender3_preset(self) -> None:
-        """Test loading Ender 3 preset."""
-        config = PrinterConfig.from_preset("ender3")
-        assert config.name == "Ender 3"
-        assert config.max_width_mm == 220
-        assert config.max_depth_mm == 220
+    @pytest.mark.parametrize(
+        "preset,name,max_width_mm,max_depth_mm",
+        [
+            ("bambu-x1c", "Bambu Lab X1C", 256, 256),
+            ("bambu-p1p", "Bambu Lab P1P", 256, 256),
+            ("prusa-mk4", "Prusa MK4", 250, 210),
+            ("prusa-mini", "Prusa Mini", 180, 180),
+            ("ender3", "Ender 3", 220, 220),
+        ],
+    )
+    def test_preset_values(
+        self, preset: str, name: str, max_width_mm: float, max_depth_mm: float
+    ) -> None:
+        """Test each preset loads the expected name and build volume."""
+        config = PrinterConfig.from_preset(preset)
+        assert (config.name, config.max_width_mm, config.max_depth_mm) == (
+            name,
+            max_width_mm,
+            max_depth_mm,
+        )
 
     def test_invalid_preset_name(self) -> None:
         """Test invalid preset name raises ValueError."""
@@ -53,6 +42,10 @@ class TestPrinterConfigFromPreset:
         with pytest.raises(ValueError, match="bambu-x1c"):
             PrinterConfig.from_preset("unknown")
 
+    def test_preset_instance_is_cached(self) -> None:
+        """Test repeated lookups return the same cached instance."""
+        assert PrinterConfig.from_preset("bambu-x1c") is PrinterConfig.from_preset("bambu-x1c")
+
     @pytest.mark.parametrize(
         "preset",
         ["bambu-x1c", "bambu-p1p", "prusa-mk4", "prusa-mini", "ender3"],
@@ -64,6 +57,15 @@ class TestPrinterConfigFromPreset:
         assert config.max_width_mm > 0
         assert config.max_depth_mm > 0
 
+    def test_presets_are_read_only(self) -> None:
+        """Test that the preset table cannot be modified at runtime."""
+        with pytest.raises(TypeError):
+            PRINTER_PRESETS["custom"] = ("Custom", 100, 100)  # type: ignore[index]
+
+    def test_choices_match_presets(self) -> None:
+        """Test that the CLI choice tuple lists every preset."""
+        assert tuple(PRINTER_PRESETS) == PRINTER_CHOICES
+
 
 class TestPrinterConfigFromCustom:
     """Tests for PrinterConfig.from_custom class method."""
@@ -116,6 +118,12 @@ class TestPrinterConfigDataclass:
         config2 = PrinterConfig(name="Printer2", max_width_mm=256.0, max_depth_mm=256.0)
         assert config1 != config2
 
+    def test_immutable(self) -> None:
+        """Test configs cannot be modified after creation."""
+        config = PrinterConfig.from_preset("bambu-x1c")
+        with pytest.raises(FrozenInstanceError):
+            config.max_width_mm = 100.0  # type: ignore[misc]
+
     def test_repr(self) -> None:
         """Test repr includes all attributes."""
         config = PrinterConfig(name="Test", max_width_mm=256.0, max_depth_mm=256.0)
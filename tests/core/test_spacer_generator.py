@@ -1,5 +1,6 @@
 """Tests for spacer generator."""
 
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -71,6 +72,13 @@ class TestSpacerGeneratorInitialization:
         with pytest.raises(ValueError):
             SpacerGenerator(30.0, 340.0)
 
+    def test_slots_reject_unknown_attributes(self) -> None:
+        """Test generator uses __slots__ instead of a per-instance __dict__."""
+        gen = SpacerGenerator(330.0, 340.0)
+        assert not hasattr(gen, "__dict__")
+        with pytest.raises(AttributeError):
+            gen.unknown = True  # type: ignore[attr-defined]
+
     def test_fractional_dimensions(self) -> None:
         """Test fractional dimensions are accepted."""
         gen = SpacerGenerator(292.1, 520.7)
@@ -78,7 +86,22 @@ class TestSpacerGeneratorInitialization:
         assert gen.depth_mm == 520.7
 
 
-class TestSpacerGeneratorLazyInitialization:
+class PatchedSpacer:
+    """Mixin that patches GridfinityDrawerSpacer for every test in the class."""
+
+    mock_spacer_class: MagicMock
+    mock_instance: MagicMock
+
+    @pytest.fixture(autouse=True)
+    def _mock_spacer(self) -> Iterator[None]:
+        """Patch GridfinityDrawerSpacer for every test in the class."""
+        with patch("cqgridfinity.GridfinityDrawerSpacer", spec=True) as mock_spacer_class:
+            self.mock_spacer_class = mock_spacer_class
+            self.mock_instance = mock_spacer_class.return_value
+            yield
+
+
+class TestSpacerGeneratorLazyInitialization(PatchedSpacer):
     """Tests for lazy initialization of underlying spacer."""
 
     def test_spacer_not_created_on_init(self) -> None:
@@ -86,152 +109,125 @@ class TestSpacerGeneratorLazyInitialization:
         gen = SpacerGenerator(330.0, 340.0)
         assert gen._spacer is None
 
-    @patch("gridfinity_tools.core.spacer_generator.GridfinityDrawerSpacer")
-    def test_spacer_created_on_first_use(self, mock_spacer_class: MagicMock) -> None:
+    def test_spacer_created_on_first_use(self) -> None:
         """Test that underlying spacer is created on first method call."""
         gen = SpacerGenerator(330.0, 340.0)
-        mock_instance = MagicMock()
-        mock_spacer_class.return_value = mock_instance
-
         # Trigger creation
         gen.generate_half_set()
 
         # Verify spacer was created
-        mock_spacer_class.assert_called_once()
+        self.mock_spacer_class.assert_called_once()
 
-    @patch("gridfinity_tools.core.spacer_generator.GridfinityDrawerSpacer")
-    def test_spacer_reused_on_multiple_calls(self, mock_spacer_class: MagicMock) -> None:
+    def test_spacer_reused_on_multiple_calls(self) -> None:
         """Test that underlying spacer is reused on multiple calls."""
         gen = SpacerGenerator(330.0, 340.0)
-        mock_instance = MagicMock()
-        mock_spacer_class.return_value = mock_instance
-
         # Make multiple calls
         gen.generate_half_set()
         gen.generate_full_set()
 
         # Verify spacer was created only once
-        assert mock_spacer_class.call_count == 1
+        self.mock_spacer_class.assert_called_once()
 
 
-class TestSpacerGeneratorGeneration:
+class TestSpacerGeneratorGeneration(PatchedSpacer):
     """Tests for spacer generation methods."""
 
-    @patch("gridfinity_tools.core.spacer_generator.GridfinityDrawerSpacer")
-    def test_generate_half_set(self, mock_spacer_class: MagicMock) -> None:
+    def test_generate_half_set(self) -> None:
         """Test generating half set."""
-        mock_instance = MagicMock()
-        mock_instance.cq_obj = MagicMock()
-        mock_spacer_class.return_value = mock_instance
-
         gen = SpacerGenerator(330.0, 340.0)
         result = gen.generate_half_set()
 
-        mock_instance.render_half_set.assert_called_once()
+        self.mock_instance.render_half_set.assert_called_once()
         assert result is not None
 
-    @patch("gridfinity_tools.core.spacer_generator.GridfinityDrawerSpacer")
-    def test_generate_full_set(self, mock_spacer_class: MagicMock) -> None:
+    def test_generate_full_set(self) -> None:
         """Test generating full set."""
-        mock_instance = MagicMock()
-        mock_instance.cq_obj = MagicMock()
-        mock_spacer_class.return_value = mock_instance
-
         gen = SpacerGenerator(330.0, 340.0)
         result = gen.generate_full_set()
 
-        mock_instance.render_full_set.assert_called_once_with()
+        self.mock_instance.render_full_set.assert_called_once_with()
         assert result is not None
 
-    @patch("gridfinity_tools.core.spacer_generator.GridfinityDrawerSpacer")
-    def test_generate_full_assembly_with_baseplate(self, mock_spacer_class: MagicMock) -> None:
+    def test_generate_full_assembly_with_baseplate(self) -> None:
         """Test generating full assembly with baseplate."""
-        mock_instance = MagicMock()
-        mock_instance.cq_obj = MagicMock()
-        mock_spacer_class.return_value = mock_instance
-
         gen = SpacerGenerator(330.0, 340.0)
         result = gen.generate_full_assembly(include_baseplate=True)
 
-        mock_instance.render_full_set.assert_called_once_with(include_baseplate=True)
+        self.mock_instance.render_full_set.assert_called_once_with(include_baseplate=True)
         assert result is not None
 
-    @patch("gridfinity_tools.core.spacer_generator.GridfinityDrawerSpacer")
-    def test_generate_full_assembly_without_baseplate(self, mock_spacer_class: MagicMock) -> None:
+    def test_generate_full_assembly_without_baseplate(self) -> None:
         """Test generating full assembly without baseplate."""
-        mock_instance = MagicMock()
-        mock_instance.cq_obj = MagicMock()
-        mock_spacer_class.return_value = mock_instance
-
         gen = SpacerGenerator(330.0, 340.0)
         result = gen.generate_full_assembly(include_baseplate=False)
 
-        mock_instance.render_full_set.assert_called_once_with(include_baseplate=False)
+        self.mock_instance.render_full_set.assert_called_once_with(include_baseplate=False)
         assert result is not None
 
+    def test_repeat_render_mode_is_skipped(self) -> None:
+        """Test the same render mode is only rendered once."""
+        gen = SpacerGenerator(330.0, 340.0)
+        gen.generate_half_set()
+        gen.generate_half_set()
+
+        self.mock_instance.render_half_set.assert_called_once()
+
+    def test_render_mode_change_renders_again(self) -> None:
+        """Test switching render mode rebuilds the geometry."""
+        gen = SpacerGenerator(330.0, 340.0)
+        gen.generate_half_set()
+        gen.generate_full_set()
+        gen.generate_half_set()
+
+        assert self.mock_instance.render_half_set.call_count == 2
+        self.mock_instance.render_full_set.assert_called_once_with()
+
 
-class TestSpacerGeneratorFileOutput:
+class TestSpacerGeneratorFileOutput(PatchedSpacer):
     """Tests for file output methods."""
 
-    @patch("gridfinity_tools.core.spacer_generator.GridfinityDrawerSpacer")
-    def test_save_stl_half_set(self, mock_spacer_class: MagicMock) -> None:
+    @patch("gridfinity_tools.core.spacer_generator.write_binary_stl")
+    def test_save_stl_half_set(self, mock_write_stl: MagicMock) -> None:
         """Test saving STL half set."""
-        mock_instance = MagicMock()
-        mock_spacer_class.return_value = mock_instance
-
         gen = SpacerGenerator(330.0, 340.0)
         gen.save_stl("test.stl", render_mode="half_set")
 
-        mock_instance.render_half_set.assert_called_once()
-        mock_instance.save_stl_file.assert_called_once_with("test.stl")
+        self.mock_instance.render_half_set.assert_called_once()
+        mock_write_stl.assert_called_once_with(self.mock_instance.cq_obj, "test.stl")
 
-    @patch("gridfinity_tools.core.spacer_generator.GridfinityDrawerSpacer")
-    def test_save_stl_full_set(self, mock_spacer_class: MagicMock) -> None:
+    @patch("gridfinity_tools.core.spacer_generator.write_binary_stl")
+    def test_save_stl_full_set(self, mock_write_stl: MagicMock) -> None:
         """Test saving STL full set."""
-        mock_instance = MagicMock()
-        mock_spacer_class.return_value = mock_instance
-
         gen = SpacerGenerator(330.0, 340.0)
         gen.save_stl("test.stl", render_mode="full_set")
 
-        mock_instance.render_full_set.assert_called_once()
-        mock_instance.save_stl_file.assert_called_once_with("test.stl")
+        self.mock_instance.render_full_set.assert_called_once()
+        mock_write_stl.assert_called_once_with(self.mock_instance.cq_obj, "test.stl")
 
-    @patch("gridfinity_tools.core.spacer_generator.GridfinityDrawerSpacer")
-    def test_save_stl_with_path_object(self, mock_spacer_class: MagicMock) -> None:
+    @patch("gridfinity_tools.core.spacer_generator.write_binary_stl")
+    def test_save_stl_with_path_object(self, mock_write_stl: MagicMock) -> None:
         """Test saving STL with Path object."""
-        mock_instance = MagicMock()
-        mock_spacer_class.return_value = mock_instance
-
         gen = SpacerGenerator(330.0, 340.0)
         path = Path("output/test.stl")
         gen.save_stl(path)
 
-        mock_instance.save_stl_file.assert_called_once_with(str(path))
+        mock_write_stl.assert_called_once_with(self.mock_instance.cq_obj, path)
 
-    @patch("gridfinity_tools.core.spacer_generator.GridfinityDrawerSpacer")
-    def test_save_step_full_assembly(self, mock_spacer_class: MagicMock) -> None:
+    def test_save_step_full_assembly(self) -> None:
         """Test saving STEP full assembly."""
-        mock_instance = MagicMock()
-        mock_spacer_class.return_value = mock_instance
-
         gen = SpacerGenerator(330.0, 340.0)
         gen.save_step("test.step", render_mode="full_assembly")
 
-        mock_instance.render_full_set.assert_called_once_with(include_baseplate=True)
-        mock_instance.save_step_file.assert_called_once_with("test.step")
+        self.mock_instance.render_full_set.assert_called_once_with(include_baseplate=True)
+        self.mock_instance.save_step_file.assert_called_once_with("test.step")
 
-    @patch("gridfinity_tools.core.spacer_generator.GridfinityDrawerSpacer")
-    def test_save_step_full_set(self, mock_spacer_class: MagicMock) -> None:
+    def test_save_step_full_set(self) -> None:
         """Test saving STEP full set."""
-        mock_instance = MagicMock()
-        mock_spacer_class.return_value = mock_instance
-
         gen = SpacerGenerator(330.0, 340.0)
         gen.save_step("test.step", render_mode="full_set")
 
-        mock_instance.render_full_set.assert_called_once_with()
-        mock_instance.save_step_file.assert_called_once_with("test.step")
+        self.mock_instance.render_full_set.assert_called_once_with()
+        self.mock_instance.save_step_file.assert_called_once_with("test.step")
 
     def test_save_stl_invalid_render_mode(self) -> None:
         """Test saving STL with invalid render mode."""
@@ -246,32 +242,24 @@ class TestSpacerGeneratorFileOutput:
             gen.save_step("test.step", render_mode="invalid")
 
 
-class TestSpacerGeneratorSpacerCreationParams:
+class TestSpacerGeneratorSpacerCreationParams(PatchedSpacer):
     """Tests for parameter passing to underlying GridfinityDrawerSpacer."""
 
-    @patch("gridfinity_tools.core.spacer_generator.GridfinityDrawerSpacer")
-    def test_spacer_params_default(self, mock_spacer_class: MagicMock) -> None:
+    def test_spacer_params_default(self) -> None:
         """Test default parameters passed to GridfinityDrawerSpacer."""
-        mock_instance = MagicMock()
-        mock_spacer_class.return_value = mock_instance
-
         gen = SpacerGenerator(330.0, 340.0)
         gen.generate_half_set()
 
         # Check that GridfinityDrawerSpacer was called with correct params
-        call_kwargs = mock_spacer_class.call_args[1]
+        call_kwargs = self.mock_spacer_class.call_args.kwargs
         assert call_kwargs["thickness"] == 5.0
         assert call_kwargs["tolerance"] == 1.0
         assert call_kwargs["chamf_rad"] == 1.0
         assert call_kwargs["show_arrows"] is True
         assert call_kwargs["align_features"] is True
 
-    @patch("gridfinity_tools.core.spacer_generator.GridfinityDrawerSpacer")
-    def test_spacer_params_custom(self, mock_spacer_class: MagicMock) -> None:
+    def test_spacer_params_custom(self) -> None:
         """Test custom parameters passed to GridfinityDrawerSpacer."""
-        mock_instance = MagicMock()
-        mock_spacer_class.return_value = mock_instance
-
         gen = SpacerGenerator(
             330.0,
             340.0,
@@ -285,7 +273,7 @@ class TestSpacerGeneratorSpacerCreationParams:
         gen.generate_half_set()
 
         # Check that GridfinityDrawerSpacer was called with correct params
-        call_kwargs = mock_spacer_class.call_args[1]
+        call_kwargs = self.mock_spacer_class.call_args.kwargs
         assert call_kwargs["thickness"] == 3.0
         assert call_kwargs["tolerance"] == 0.5
         assert call_kwargs["chamf_rad"] == 0.8
@@ -1,6 +1,8 @@
 """Tests for __main__ module."""
 
-from unittest.mock import patch
+from unittest.mock import Mock
+
+import pytest
 
 from gridfinity_tools.__main__ import main
 
@@ -8,29 +10,23 @@ from gridfinity_tools.__main__ import main
 class TestMainEntry:
     """Tests for main entry point."""
 
-    @patch("gridfinity_tools.__main__.cli")
-    def test_main_calls_cli(self, mock_cli: object) -> None:
-        """Test that main calls the CLI."""
-        result = main()
-
-        assert result == 0
-        # Verify cli was called
-        assert callable(mock_cli)
-
-    @patch("gridfinity_tools.__main__.cli")
-    def test_main_with_cli_error(self, mock_cli: object) -> None:
-        """Test that main handles SystemExit from CLI."""
-        with patch("gridfinity_tools.__main__.cli") as mock_cli_func:
-            mock_cli_func.side_effect = SystemExit(1)
-            result = main()
-
-            assert result == 1
-
-    @patch("gridfinity_tools.__main__.cli")
-    def test_main_with_non_int_exit_code(self, mock_cli: object) -> None:
-        """Test that main handles non-int SystemExit codes."""
-        with patch("gridfinity_tools.__main__.cli") as mock_cli_func:
-            mock_cli_func.side_effect = SystemExit("error")
-            result = main()
-
-            assert result == 1
+    @pytest.mark.parametrize(
+        "side_effect,expected",
+        [
+            (None, 0),
+            (SystemExit(1), 1),
+            (SystemExit("error"), 1),  # non-int exit codes map to 1
+        ],
+    )
+    def test_main_exit_code(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        side_effect: BaseException | None,
+        expected: int,
+    ) -> None:
+        """Test that main calls the CLI and turns its exit into a return code."""
+        mock_cli = Mock(side_effect=side_effect)
+        monkeypatch.setattr("gridfinity_tools.__main__.cli", mock_cli)
+
+        assert main() == expected
+        mock_cli.assert_called_once_with()
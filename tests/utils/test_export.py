@@ -0,0 +1,76 @@
+"""Tests for CAD file export utilities."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import cadquery as cq
+import pytest
+
+from gridfinity_tools.utils.export import ensure_output_dir, write_binary_stl
+
+
+class TestEnsureOutputDir:
+    """Tests for ensure_output_dir function."""
+
+    def test_creates_nested_directory(self, tmp_path: Path) -> None:
+        """Test missing nested directories are created."""
+        result = ensure_output_dir(tmp_path / "output" / "subfolder")
+        assert result == tmp_path / "output" / "subfolder"
+        assert result.is_dir()
+
+    def test_existing_directory(self, tmp_path: Path) -> None:
+        """Test existing directory is accepted."""
+        assert ensure_output_dir(str(tmp_path)) == tmp_path
+
+    def test_returns_absolute_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test relative paths are resolved against the working directory."""
+        monkeypatch.chdir(tmp_path)
+        result = ensure_output_dir("output")
+        assert result.is_absolute()
+        assert result == tmp_path.resolve() / "output"
+
+
+class TestWriteBinaryStl:
+    """Tests for write_binary_stl function."""
+
+    def test_exports_binary_stl(self) -> None:
+        """Test STL is exported in binary mode with default mesh settings."""
+        cq_obj = MagicMock()
+        write_binary_stl(cq_obj, Path("output/test.stl"))
+
+        cq_obj.val.return_value.exportStl.assert_called_once_with(
+            "output/test.stl",
+            tolerance=1e-2,
+            angularTolerance=0.1,
+            ascii=False,
+            relative=True,
+            parallel=True,
+        )
+
+    def test_custom_tolerances(self) -> None:
+        """Test custom mesh tolerances are passed through."""
+        cq_obj = MagicMock()
+        write_binary_stl(cq_obj, "test.stl", tolerance=0.5, angular_tolerance=0.2)
+
+        call_kwargs = cq_obj.val.return_value.exportStl.call_args.kwargs
+        assert call_kwargs["tolerance"] == 0.5
+        assert call_kwargs["angularTolerance"] == 0.2
+
+    def test_write_failure_raises(self) -> None:
+        """Test failed write raises OSError."""
+        cq_obj = MagicMock()
+        cq_obj.val.return_value.exportStl.return_value = False
+
+        with pytest.raises(OSError, match="Failed to write STL file"):
+            write_binary_stl(cq_obj, "test.stl")
+
+    def test_writes_binary_file(self, tmp_path: Path) -> None:
+        """Test a real solid is written with binary STL layout."""
+        path = tmp_path / "box.stl"
+        write_binary_stl(cq.Workplane("XY").box(10, 10, 10), path)
+
+        data = path.read_bytes()
+        triangle_count = int.from_bytes(data[80:84], "little")
+        # A box has 6 faces of 2 triangles; binary STL is 84 + 50 bytes per triangle
+        assert triangle_count == 12
+        assert len(data) == 84 + 50 * triangle_count
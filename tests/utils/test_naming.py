@@ -45,6 +45,15 @@ class TestGenerateSpacerFilename:
         result = generate_spacer_filename(330.0, 340.0, 0.75, "half_set", "stl")
         assert result == "drawer_330x340_tol0.75_spacer_half_set.stl"
 
+    def test_cache_keeps_int_and_float_tolerance_distinct(self) -> None:
+        """Test cached filenames keep the tolerance spelling of each call."""
+        assert generate_spacer_filename(330.0, 340.0, 2.0, "half_set", "stl") == (
+            "drawer_330x340_tol2.0_spacer_half_set.stl"
+        )
+        assert generate_spacer_filename(330.0, 340.0, 2, "half_set", "stl") == (
+            "drawer_330x340_tol2_spacer_half_set.stl"
+        )
+
     @pytest.mark.parametrize(
         "width,depth,tol,mode,fmt,expected",
         [
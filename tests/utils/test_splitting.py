@@ -1,5 +1,7 @@
 """Tests for baseplate splitting utilities."""
 
+import math
+
 import pytest
 
 from gridfinity_tools.utils.splitting import (
@@ -61,14 +63,14 @@ class TestCalculateBaseplateSplit:
     def test_single_piece_fits(self) -> None:
         """Test baseplate that fits in one piece."""
         result = calculate_baseplate_split(5, 256)
-        assert result == [5]
+        assert result == (5,)
         assert len(result) == 1
 
     def test_single_piece_at_boundary(self) -> None:
         """Test baseplate exactly at max dimension."""
         # 6 units = 252mm, which is <= 256mm
         result = calculate_baseplate_split(6, 256)
-        assert result == [6]
+        assert result == (6,)
 
     def test_split_into_two_pieces(self) -> None:
         """Test baseplate that needs to split into 2 pieces."""
@@ -108,6 +110,10 @@ class TestCalculateBaseplateSplit:
         assert len(result) > 1
         assert sum(result) == 11
 
+    def test_result_is_cached(self) -> None:
+        """Test repeated calls return the same cached tuple."""
+        assert calculate_baseplate_split(13, 256) is calculate_baseplate_split(13, 256)
+
     def test_invalid_zero_units(self) -> None:
         """Test zero units raises ValueError."""
         with pytest.raises(ValueError, match="must be at least 1"):
@@ -131,14 +137,14 @@ class TestCalculateBaseplateSplit:
     @pytest.mark.parametrize(
         "total_units,max_mm,expected",
         [
-            (5, 256, [5]),  # Fits in one
-            (6, 256, [6]),  # Exactly at boundary
-            (7, 256, [4, 3]),  # Needs split (7 * 42 = 294mm)
-            (13, 256, [5, 4, 4]),  # Large split (13 * 42 = 546mm needs 3)
-            (11, 256, [6, 5]),  # Another large split (11 * 42 = 462mm needs 2)
+            (5, 256, (5,)),  # Fits in one
+            (6, 256, (6,)),  # Exactly at boundary
+            (7, 256, (4, 3)),  # Needs split (7 * 42 = 294mm)
+            (13, 256, (5, 4, 4)),  # Large split (13 * 42 = 546mm needs 3)
+            (11, 256, (6, 5)),  # Another large split (11 * 42 = 462mm needs 2)
         ],
     )
-    def test_various_splits(self, total_units: int, max_mm: int, expected: list[int]) -> None:
+    def test_various_splits(self, total_units: int, max_mm: int, expected: tuple[int, ...]) -> None:
         """Test various splitting scenarios."""
         result = calculate_baseplate_split(total_units, max_mm)
         assert result == expected
@@ -150,8 +156,8 @@ class TestCalculateSplitGrid:
     def test_single_piece_grid(self) -> None:
         """Test grid that fits in one piece."""
         width_pieces, depth_pieces = calculate_split_grid(5, 6, 256, 256)
-        assert width_pieces == [5]
-        assert depth_pieces == [6]
+        assert width_pieces == (5,)
+        assert depth_pieces == (6,)
 
     def test_two_piece_grid(self) -> None:
         """Test 2D grid that needs splitting in both dimensions."""
@@ -193,6 +199,11 @@ class TestCalculateSplitGrid:
         assert sum(width_pieces) == width_u
         assert sum(depth_pieces) == depth_u
 
+    def test_result_is_cached(self) -> None:
+        """Test repeated calls return the same cached grid."""
+        first = calculate_split_grid(13, 11, 256, 256)
+        assert calculate_split_grid(13, 11, 256, 256) is first
+
 
 class TestCalculateTotalPieces:
     """Tests for calculate_total_pieces function."""
@@ -234,3 +245,13 @@ class TestCalculateTotalPieces:
         """Test various total piece calculations."""
         result = calculate_total_pieces(width_u, depth_u, 256, 256)
         assert result == total
+
+    def test_closed_form_matches(self) -> None:
+        """Test piece counts against ceil(mm / max_mm) per axis on a 19x19 grid."""
+        for width_u in range(1, 20):
+            for depth_u in range(1, 20):
+                expected = math.ceil(width_u * 42 / 256) * math.ceil(depth_u * 42 / 256)
+                assert calculate_total_pieces(width_u, depth_u, 256, 256) == expected, (
+                    width_u,
+                    depth_u,
+                )
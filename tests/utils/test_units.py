@@ -2,7 +2,16 @@
 
 import pytest
 
-from gridfinity_tools.utils.units import inches_to_mm, mm_to_inches, parse_dimension
+from gridfinity_tools.utils.units import convert, inches_to_mm, mm_to_inches, parse_dimension
+
+# (inches, mm) pairs shared by the inches_to_mm and mm_to_inches tests
+CONVERSIONS = (
+    (1.0, 25.4),
+    (10.0, 254.0),
+    (11.5, 292.1),
+    (20.5, 520.7),
+    (0.5, 12.7),
+)
 
 
 class TestInchesToMm:
@@ -20,16 +29,7 @@ class TestInchesToMm:
         """Test converting zero inches."""
         assert inches_to_mm(0.0) == 0.0
 
-    @pytest.mark.parametrize(
-        "inches,expected_mm",
-        [
-            (1.0, 25.4),
-            (10.0, 254.0),
-            (11.5, 292.1),
-            (20.5, 520.7),
-            (0.5, 12.7),
-        ],
-    )
+    @pytest.mark.parametrize("inches,expected_mm", CONVERSIONS)
     def test_various_conversions(self, inches: float, expected_mm: float) -> None:
         """Test various inch to mm conversions."""
         assert inches_to_mm(inches) == pytest.approx(expected_mm)
@@ -50,21 +50,36 @@ class TestMmToInches:
         """Test converting zero mm."""
         assert mm_to_inches(0.0) == 0.0
 
-    @pytest.mark.parametrize(
-        "mm,expected_inches",
-        [
-            (25.4, 1.0),
-            (254.0, 10.0),
-            (292.1, 11.5),
-            (520.7, 20.5),
-            (12.7, 0.5),
-        ],
-    )
+    @pytest.mark.parametrize("mm,expected_inches", [(mm, inches) for inches, mm in CONVERSIONS])
     def test_various_conversions(self, mm: float, expected_inches: float) -> None:
         """Test various mm to inch conversions."""
         assert mm_to_inches(mm) == pytest.approx(expected_inches)
 
 
+class TestConvert:
+    """Tests for convert function."""
+
+    def test_inches_to_mm(self) -> None:
+        """Test converting inches to mm matches inches_to_mm."""
+        assert convert(11.5, "in", "mm") == inches_to_mm(11.5)
+
+    def test_mm_to_inches(self) -> None:
+        """Test converting mm to inches matches mm_to_inches."""
+        assert convert(292.1, "mm", "in") == mm_to_inches(292.1)
+        assert convert(25.4, "mm", "in") == 1.0
+
+    @pytest.mark.parametrize("unit", ["mm", "in"])
+    def test_same_unit_returns_value(self, unit: str) -> None:
+        """Test converting to the same unit returns the value unchanged."""
+        assert convert(12.3, unit, unit) == 12.3
+
+    @pytest.mark.parametrize(("from_unit", "to_unit"), [("cm", "mm"), ("mm", "ft"), ("ft", "ft")])
+    def test_unknown_unit(self, from_unit: str, to_unit: str) -> None:
+        """Test unknown units raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown unit"):
+            convert(1.0, from_unit, to_unit)
+
+
 class TestParseDimension:
     """Tests for parse_dimension function."""
 
@@ -99,6 +114,25 @@ class TestParseDimension:
         with pytest.raises(ValueError, match="Invalid inch dimension format"):
             parse_dimension("abcin")
 
+    def test_parse_invalid_format_reports_input_as_given(self) -> None:
+        """Test error messages echo the stripped input without lowercasing it."""
+        with pytest.raises(ValueError, match="Invalid inch dimension format: ABCIN$"):
+            parse_dimension(" ABCIN ")
+
+    def test_parse_uppercase_exponent(self) -> None:
+        """Test the numeric part is handed to float() unchanged."""
+        assert parse_dimension("1E2") == 100.0
+
+    @pytest.mark.parametrize("input_str", ["nan", "inf", "-inf", "nanin", "infin", "in"])
+    def test_parse_rejects_non_finite_numbers(self, input_str: str) -> None:
+        """Test non-finite or missing numbers are rejected."""
+        with pytest.raises(ValueError, match="dimension format"):
+            parse_dimension(input_str)
+
+    def test_parse_inches_with_space_before_suffix(self) -> None:
+        """Test inch suffix may be separated from the number by whitespace."""
+        assert parse_dimension("11.5 in") == pytest.approx(292.1)
+
     def test_parse_negative_mm(self) -> None:
         """Test parsing negative mm raises ValueError."""
         with pytest.raises(ValueError, match="must be positive"):
@@ -119,6 +153,14 @@ class TestParseDimension:
         with pytest.raises(ValueError, match="must be positive"):
             parse_dimension("0in")
 
+    def test_parse_result_is_cached(self) -> None:
+        """Test repeated parsing of the same string hits the cache."""
+        parse_dimension.cache_clear()
+        parse_dimension("330")
+        parse_dimension("330")
+
+        assert parse_dimension.cache_info().hits == 1
+
     @pytest.mark.parametrize(
         "input_str,expected_mm",
         [